@@ -6,7 +6,8 @@ import inspect
 import re
 from dataclasses import asdict
 from datetime import date
-from typing import Callable, get_type_hints
+from types import MappingProxyType
+from typing import Callable, Mapping, get_type_hints
 
 from pydantic import BaseModel as _PydanticBaseModel
 
@@ -22,6 +23,17 @@ from algo_sdk.core import (
     LoggingConfig,
 )
 
+# Per-class flag recording that the decorator's class checks have passed.
+_VALIDATED_ATTR = "__algo_deco_validated__"
+
+# Shared read-only payloads for decorations without custom configs.
+_DEFAULT_EXEC_PAYLOAD: Mapping[str, object] = MappingProxyType(
+    asdict(ExecutionConfig())
+)
+_DEFAULT_LOG_PAYLOAD: Mapping[str, object] = MappingProxyType(
+    asdict(LoggingConfig())
+)
+
 
 class DefaultAlgorithmDecorator:
     """Decorator used to mark class-based algorithms."""
@@ -97,8 +109,16 @@ class DefaultAlgorithmDecorator:
                     "display_name must be a non-empty string"
                 )
 
-        exec_config = self._build_execution_config(execution)
-        log_config = self._build_logging_config(logging)
+        execution_payload: Mapping[str, object] = (
+            asdict(self._build_execution_config(execution))
+            if execution
+            else _DEFAULT_EXEC_PAYLOAD
+        )
+        logging_payload: Mapping[str, object] = (
+            asdict(self._build_logging_config(logging))
+            if logging
+            else _DEFAULT_LOG_PAYLOAD
+        )
         (
             created_time,
             author,
@@ -113,9 +133,6 @@ class DefaultAlgorithmDecorator:
             extra=extra,
         )
 
-        execution_payload = asdict(exec_config)
-        logging_payload = asdict(log_config)
-
         def _decorator(
             target: type[BaseAlgorithm[BaseModel, BaseModel]],
         ) -> type[BaseAlgorithm[BaseModel, BaseModel]]:
@@ -123,24 +140,12 @@ class DefaultAlgorithmDecorator:
                 raise AlgorithmValidationError(
                     "decorator target must be a class"
                 )
-            if not issubclass(target, BaseAlgorithm):
-                raise AlgorithmValidationError(
-                    "algorithm must inherit BaseAlgorithm"
-                )
             run_method: object = getattr(target, "run", None)
-            if run_method is None or not callable(run_method):
-                raise AlgorithmValidationError(
-                    "class-based algorithm must define a callable 'run' method"
-                )
-            if getattr(run_method, "__isabstractmethod__", False):
-                raise AlgorithmValidationError(
-                    "class-based algorithm must provide a concrete 'run' "
-                    "method"
-                )
-            if inspect.isabstract(target):
-                raise AlgorithmValidationError(
-                    "class-based algorithm must not be abstract"
-                )
+            # Cached in the class's own __dict__ so subclasses are still
+            # validated on their first decoration.
+            if target.__dict__.get(_VALIDATED_ATTR) is not True:
+                self._validate_target(target, run_method)
+                setattr(target, _VALIDATED_ATTR, True)
 
             _, _, inferred_hyperparams = self._extract_io(run_method)
             marker = AlgorithmMarker(
@@ -163,6 +168,28 @@ class DefaultAlgorithmDecorator:
 
         return _decorator
 
+    def _validate_target(
+        self,
+        target: type[BaseAlgorithm[BaseModel, BaseModel]],
+        run_method: object,
+    ) -> None:
+        if not issubclass(target, BaseAlgorithm):
+            raise AlgorithmValidationError(
+                "algorithm must inherit BaseAlgorithm"
+            )
+        if run_method is None or not callable(run_method):
+            raise AlgorithmValidationError(
+                "class-based algorithm must define a callable 'run' method"
+            )
+        if getattr(run_method, "__isabstractmethod__", False):
+            raise AlgorithmValidationError(
+                "class-based algorithm must provide a concrete 'run' method"
+            )
+        if inspect.isabstract(target):
+            raise AlgorithmValidationError(
+                "class-based algorithm must not be abstract"
+            )
+
     def _build_execution_config(
         self, execution: dict[str, object] | None
     ) -> ExecutionConfig:
@@ -283,7 +310,13 @@ class DefaultAlgorithmDecorator:
             raise AlgorithmValidationError(
                 "redact_fields must be a list of str"
             )
-        redact_tuple: tuple[str, ...] = tuple(str(f) for f in redact_fields)
+        redact_tuple: tuple[str, ...]
+        if isinstance(redact_fields, tuple) and all(
+            type(f) is str for f in redact_fields
+        ):
+            redact_tuple = redact_fields
+        else:
+            redact_tuple = tuple(str(f) for f in redact_fields)
 
         return LoggingConfig(
             enabled=enabled,
@@ -361,9 +394,16 @@ class DefaultAlgorithmDecorator:
         callable_obj: Callable[..., object],
         *,
         skip_first: bool = True,
+        _Base: type[_PydanticBaseModel] = _PydanticBaseModel,
+        _HP: type[HyperParams] = HyperParams,
+        _empty: object = inspect.Signature.empty,
+        _isclass: Callable[[object], bool] = inspect.isclass,
     ) -> tuple[type[BaseModel], type[BaseModel], type[HyperParams] | None]:
         """Extract input/output models from callable signature.
 
+        The underscore-prefixed keyword defaults bind module globals as
+        locals for faster lookup; callers must not pass them.
+
         Args:
             run_method: The run method of the algorithm class
 
@@ -381,17 +421,26 @@ class DefaultAlgorithmDecorator:
             )
 
         param = params[0]
-        type_hints = get_type_hints(callable_obj, include_extras=False)
+        raw_hints: dict[str, object] = getattr(
+            callable_obj, "__annotations__", {}
+        )
+        # Plain class annotations need no resolution; strings, ForwardRefs
+        # and Annotated/generic aliases still go through get_type_hints.
+        type_hints: dict[str, object]
+        if all(isinstance(hint, type) for hint in raw_hints.values()):
+            type_hints = raw_hints
+        else:
+            type_hints = get_type_hints(callable_obj, include_extras=False)
         annotation: object = type_hints.get(
             param.name, param.annotation  # pyright: ignore[reportAny]
         )
-        if annotation is inspect.Signature.empty:
+        if annotation is _empty:
             raise AlgorithmValidationError(
                 "input must be type-annotated with a BaseModel subclass"
             )
         if not (
-            inspect.isclass(annotation)
-            and issubclass(annotation, _PydanticBaseModel)
+            _isclass(annotation)
+            and issubclass(annotation, _Base)
         ):
             raise AlgorithmValidationError(
                 "algorithm input must be a BaseModel subclass"
@@ -403,29 +452,29 @@ class DefaultAlgorithmDecorator:
             hyper_annotation: object = type_hints.get(
                 hyper_param.name, hyper_param.annotation
             )
-            if hyper_annotation is inspect.Signature.empty:
+            if hyper_annotation is _empty:
                 raise AlgorithmValidationError(
                     "hyperparams must be type-annotated with a HyperParams "
                     "subclass"
                 )
             if not (
-                inspect.isclass(hyper_annotation)
-                and issubclass(hyper_annotation, HyperParams)
+                _isclass(hyper_annotation)
+                and issubclass(hyper_annotation, _HP)
             ):
                 raise AlgorithmValidationError(
                     "hyperparams must be a HyperParams subclass"
                 )
-            hyperparams_model = hyper_annotation  # type: ignore[assignment]
+            hyperparams_model = hyper_annotation
 
         ret_anno = sig.return_annotation  # pyright: ignore[reportAny]
         output_annotation: object = type_hints.get("return", ret_anno)
-        if output_annotation is inspect.Signature.empty:
+        if output_annotation is _empty:
             raise AlgorithmValidationError(
                 "output must be type-annotated with a BaseModel subclass"
             )
         if not (
-            inspect.isclass(output_annotation)
-            and issubclass(output_annotation, _PydanticBaseModel)
+            _isclass(output_annotation)
+            and issubclass(output_annotation, _Base)
         ):
             raise AlgorithmValidationError(
                 "algorithm output must be a BaseModel subclass"
@@ -436,7 +485,7 @@ class DefaultAlgorithmDecorator:
             annotation,
             output_annotation,
             hyperparams_model,
-        )  # type: ignore[return-value]
+        )
 
 
 # Convenience instance for common imports
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from algo_decorators import Algorithm, DefaultAlgorithmDecorator
 
+    from .http.impl import server as http_server
+
 from .core import (
     AlgorithmError,
     AlgorithmLifecycleProtocol,
@@ -45,7 +47,6 @@ from .core import (
     get_registry,
 )
 from .http import AlgorithmHttpService, ObservationHooks, create_app, run
-from .http.impl import server as http_server
 from .observability import (
     InMemoryMetrics,
     InMemoryTracer,
@@ -89,6 +90,9 @@ def __getattr__(name: str) -> Any:
     if name in {"Algorithm", "DefaultAlgorithmDecorator"}:
         module = import_module("algo_decorators")
         return getattr(module, name)
+    if name == "http_server":
+        # FastAPI is only imported once the server module is requested.
+        return import_module(".http.impl.server", __name__)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -0,0 +1,70 @@
+"""Environment variable parsing shared by the SDK settings loaders.
+
+Every helper reads ``os.environ`` unless an explicit mapping is given and
+treats unset and blank values alike.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Mapping
+
+TRUTHY = frozenset(("1", "true", "yes", "y", "on"))
+FALSY = frozenset(("0", "false", "no", "n", "off"))
+
+
+def get_env_str(
+    name: str, env: Mapping[str, str] | None = None
+) -> str | None:
+    raw = (os.environ if env is None else env).get(name)
+    if raw is None:
+        return None
+    return raw.strip() or None
+
+
+def get_env_int(
+    name: str, env: Mapping[str, str] | None = None
+) -> int | None:
+    raw = (os.environ if env is None else env).get(name)
+    if raw is None or not raw.strip():
+        return None
+    return int(raw)
+
+
+def get_env_float(
+    name: str, env: Mapping[str, str] | None = None
+) -> float | None:
+    raw = (os.environ if env is None else env).get(name)
+    if raw is None or not raw.strip():
+        return None
+    return float(raw)
+
+
+def get_env_bool(
+    name: str, env: Mapping[str, str] | None = None
+) -> bool | None:
+    raw = (os.environ if env is None else env).get(name)
+    if raw is None or not raw.strip():
+        return None
+    raw = raw.strip().lower()
+    if raw in TRUTHY:
+        return True
+    if raw in FALSY:
+        return False
+    raise ValueError(f"Invalid bool env var {name}={raw!r}")
+
+
+def get_env_bool_default(
+    name: str, default: bool, env: Mapping[str, str] | None = None
+) -> bool:
+    value = get_env_bool(name, env)
+    return default if value is None else value
+
+
+def get_env_list(
+    name: str, env: Mapping[str, str] | None = None
+) -> list[str]:
+    raw = (os.environ if env is None else env).get(name, "")
+    if not raw.strip():
+        return []
+    return [item.strip() for item in raw.split(",") if item.strip()]
@@ -13,10 +13,11 @@ import time
 import traceback
 from dataclasses import dataclass, field
 from datetime import datetime
-from threading import BoundedSemaphore, Condition, Event, Lock, Thread
+from threading import Condition, Event, Lock, Thread
 from typing import (
     Any,
     Generic,
+    Hashable,
     Literal,
     Mapping,
     MutableMapping,
@@ -119,6 +120,16 @@ def _default_max_workers() -> int:
     return max(1, workers)
 
 
+def _queue_capacity(max_workers: int, queue_size: int | None) -> int:
+    """Tasks a process pool admits at once before rejecting."""
+    slots = queue_size if queue_size is not None else max_workers * 2
+    return max(1, slots)
+
+
+# (pool identity, capacity): callers sharing a pool share its capacity.
+_AdmissionLimit = tuple[Hashable, int]
+
+
 def _coerce_input_model(
     spec: AlgorithmSpec[Any, Any], payload: Any
 ) -> BaseModel:
@@ -734,6 +745,16 @@ class InProcessExecutor(ExecutorProtocol):
     def start(self) -> None:
         self._started = True
 
+    def saturated(self, spec: AlgorithmSpec[Any, Any]) -> bool:
+        """In-process calls are never queued, so never saturated."""
+        return False
+
+    def admission_limit(
+        self, spec: AlgorithmSpec[Any, Any]
+    ) -> _AdmissionLimit | None:
+        """In-process calls have no queue to bound."""
+        return None
+
     def submit(
         self, request: ExecutionRequest[Any, Any]
     ) -> ExecutionResult[Any]:
@@ -927,8 +948,12 @@ class ProcessPoolExecutor(ExecutorProtocol):
         self._listener: Thread | None = None
         self._stop_event = Event()
         self._task_counter = 0
-        slots = queue_size if queue_size is not None else self._max_workers * 2
-        self._semaphore = BoundedSemaphore(value=max(1, slots))
+        # Admission control: submit() rejects once ``_capacity`` tasks are
+        # in flight. A plain counter lets saturated() peek without taking
+        # a slot.
+        self._capacity = _queue_capacity(self._max_workers, queue_size)
+        self._inflight = 0
+        self._inflight_lock = Lock()
 
     def start(self) -> None:
         if self._started:
@@ -952,6 +977,25 @@ class ProcessPoolExecutor(ExecutorProtocol):
             self._listener.start()
             self._started = True
 
+    def saturated(self, spec: AlgorithmSpec[Any, Any]) -> bool:
+        """Return True when ``submit`` would reject for a full queue.
+
+        A point-in-time read: a concurrent submit may still take or free
+        the last slot.
+        """
+        return self._inflight >= self._capacity
+
+    def admission_limit(
+        self, spec: AlgorithmSpec[Any, Any]
+    ) -> _AdmissionLimit | None:
+        """Return this pool and how many tasks it admits at once.
+
+        Callers that hand work to ``submit`` from other threads can count
+        against this before the hop, since ``_inflight`` only moves once
+        ``submit`` actually runs.
+        """
+        return self, self._capacity
+
     def submit(
         self, request: ExecutionRequest[Any, Any]
     ) -> ExecutionResult[Any]:
@@ -962,7 +1006,10 @@ class ProcessPoolExecutor(ExecutorProtocol):
 
         submitted_at = time.monotonic()
         result = ExecutionResult[Any](success=False, started_at=submitted_at)
-        acquired = self._semaphore.acquire(blocking=False)
+        with self._inflight_lock:
+            acquired = self._inflight < self._capacity
+            if acquired:
+                self._inflight += 1
         if not acquired:
             result.error = ExecutionError(
                 kind="rejected",
@@ -1075,7 +1122,8 @@ class ProcessPoolExecutor(ExecutorProtocol):
                     result.started_at,
                 )
             _log_execution_result(request, result)
-            self._semaphore.release()
+            with self._inflight_lock:
+                self._inflight -= 1
             if worker_index is not None and not dispatched:
                 if pending is not None:
                     with self._pending_lock:
@@ -1289,6 +1337,17 @@ class IsolatedProcessPoolExecutor(ExecutorProtocol):
     def start(self) -> None:
         self._started = True
 
+    def saturated(self, spec: AlgorithmSpec[Any, Any]) -> bool:
+        executor = self._executors.get(spec.key())
+        return executor is not None and executor.saturated(spec)
+
+    def admission_limit(
+        self, spec: AlgorithmSpec[Any, Any]
+    ) -> _AdmissionLimit | None:
+        # Computed without creating the pool; _get_executor sizes it alike.
+        workers = spec.execution.max_workers or self._default_max_workers
+        return (self, spec.key()), _queue_capacity(workers, self._queue_size)
+
     def submit(
         self, request: ExecutionRequest[Any, Any]
     ) -> ExecutionResult[Any]:
@@ -1380,6 +1439,24 @@ class DispatchingExecutor(ExecutorProtocol):
         self._isolated.start()
         self._started = True
 
+    def saturated(self, spec: AlgorithmSpec[Any, Any]) -> bool:
+        """Return True when the pool ``spec`` routes to is at capacity."""
+        if spec.execution.execution_mode == ExecutionMode.IN_PROCESS:
+            return False
+        if spec.execution.isolated_pool:
+            return self._isolated.saturated(spec)
+        return self._shared.saturated(spec)
+
+    def admission_limit(
+        self, spec: AlgorithmSpec[Any, Any]
+    ) -> _AdmissionLimit | None:
+        """Return the admission limit of the pool ``spec`` routes to."""
+        if spec.execution.execution_mode == ExecutionMode.IN_PROCESS:
+            return None
+        if spec.execution.isolated_pool:
+            return self._isolated.admission_limit(spec)
+        return self._shared.admission_limit(spec)
+
     def submit(
         self, request: ExecutionRequest[Any, Any]
     ) -> ExecutionResult[Any]:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import FrozenInstanceError, dataclass, field
 from enum import Enum
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, Mapping, TypeVar
 
 from .base_model_impl import BaseModel
 from .lifecycle import AlgorithmLifecycleProtocol
@@ -80,8 +81,8 @@ class AlgorithmMarker:
     category: str
     application_scenarios: str | None = None
     extra: dict[str, str] = field(default_factory=dict)
-    execution: dict[str, object] = field(default_factory=dict)
-    logging: dict[str, object] = field(default_factory=dict)
+    execution: Mapping[str, object] = field(default_factory=dict)
+    logging: Mapping[str, object] = field(default_factory=dict)
     hyperparams_model: type[HyperParams] | None = None
     display_name: str | None = None
 
@@ -129,6 +130,10 @@ def _schema_to_fields(schema: dict[str, Any]) -> list[dict[str, Any]]:
     return fields
 
 
+# AlgorithmSpec fields that make up key(); read-only after construction.
+_IDENTITY_FIELDS = frozenset({"name", "version"})
+
+
 @dataclass(slots=True)
 class AlgorithmSpec(Generic[TInput, TOutput]):
     """Metadata for an algorithm entry."""
@@ -153,9 +158,25 @@ class AlgorithmSpec(Generic[TInput, TOutput]):
     hyperparams_model: type[HyperParams] | None = None
     is_class: bool = False
     display_name: str | None = None
+    # (name, version), built once; dataclasses.replace() rebuilds it.
+    _key: tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so equal keys from separately built specs (reloads,
+        # replace()) compare by identity in the metrics and registry maps.
+        self.name = sys.intern(self.name)
+        self.version = sys.intern(self.version)
+        self._key = (self.name, self.version)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        # name/version are fixed once _key is built, so key() cannot go
+        # stale; use dataclasses.replace() for a spec with a new identity.
+        if attr in _IDENTITY_FIELDS and hasattr(self, "_key"):
+            raise FrozenInstanceError(f"cannot assign to field {attr!r}")
+        object.__setattr__(self, attr, value)
 
     def key(self) -> tuple[str, str]:
-        return self.name, self.version
+        return self._key
 
     def input_schema(self) -> dict[str, Any]:
         """Return JSON schema for the input model."""
@@ -46,6 +46,12 @@ class AlgorithmRegistry:
         self._items: dict[tuple[str, str], AnySpec] = {}
         self._overrides: dict[OverrideKey, dict[str, object]] = {}
         self._lock = RLock()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever registered specs change."""
+        return self._version
 
     def register(self, spec: AlgorithmSpec[Req, Resp]) -> None:
         key = spec.key()
@@ -58,6 +64,7 @@ class AlgorithmRegistry:
             # Cast to a common storage type since AlgorithmSpec is invariant.
             self._apply_overrides(spec)
             self._items[key] = cast(AnySpec, spec)
+            self._version += 1
 
     def get(self, name: str, version: str) -> AnySpec:
         key = (name, version)
@@ -180,6 +187,7 @@ class AlgorithmRegistry:
                 self._overrides[key] = override
             for spec in self._items.values():
                 self._apply_overrides(spec)
+            self._version += 1
 
     def _apply_overrides(self, spec: AlgorithmSpec[Req, Resp]) -> None:
         key = (spec.name, spec.version, spec.category, spec.algorithm_type)
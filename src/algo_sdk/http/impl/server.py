@@ -1,41 +1,59 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import importlib
 import importlib.util
+import json
 import logging
 import os
 import re
+import stat
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import asdict
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from types import ModuleType
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, List, Mapping, Optional
 
-import uvicorn
-from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import (
     HTMLResponse,
     JSONResponse,
-    PlainTextResponse,
     RedirectResponse,
+    Response,
 )
 from fastapi.staticfiles import StaticFiles
 from pydantic.alias_generators import to_camel
-
+from pydantic_core import to_json
+
+from ...config.env import (
+    get_env_bool,
+    get_env_bool_default,
+    get_env_float,
+    get_env_int,
+    get_env_list,
+)
 from ...core.executor import DispatchingExecutor
+from ...core.metadata import AlgorithmSpec
 from ...core.registry import AlgorithmRegistry, get_registry
 from ...logging import configure_logging as configure_sdk_logging
-from ...logging import get_event_logger
-from ...protocol.models import AlgorithmRequest, api_error, api_success
+from ...logging import get_event_logger, load_logging_settings
+from ...protocol.models import (
+    AlgorithmRequest,
+    AlgorithmResponse,
+    api_error,
+    api_success,
+)
 from ...runtime import (
     AlreadyInStateError,
     InvalidTransitionError,
-    ServiceLifecycleProtocol,
     ServiceState,
 )
 from ...runtime.factory import build_service_runtime
@@ -49,11 +67,84 @@ from ...service_registry.errors import ServiceRegistryError
 _LOGGER = logging.getLogger(__name__)
 _EVENT_LOGGER = get_event_logger()
 
+# Static probe bodies, encoded once instead of serialized per request.
+_JSON_MEDIA_TYPE = "application/json"
+_PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_HEALTHZ_BODY = b'{"status":"ok"}'
+_READYZ_BODY = b'{"status":"ready"}'
+
+
+def _encode_json(content: object) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON with pydantic-core.
+
+    NaN and Infinity are rejected with the same ValueError as the stdlib
+    encoder used by JSONResponse, instead of being written out.
+    """
+    body = to_json(content, inf_nan_mode="constants")
+    # pydantic-core has no raising mode; non-finite floats surface as bare
+    # NaN/Infinity tokens. Bodies that merely contain those words in a
+    # string go through the stdlib encoder too and come out unchanged.
+    if b"NaN" in body or b"Infinity" in body:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    return body
+
+
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core's Rust encoder."""
+
+    def render(self, content: object) -> bytes:
+        return _encode_json(content)
+
+
+_SWAGGER_UI_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8" />
+    <title>{title} - Swagger UI</title>
+    <link rel="stylesheet" href="/swagger-ui/swagger-ui.css" />
+    <link rel="icon" href="/swagger-ui/favicon.png" />
+  </head>
+  <body>
+    <div id="swagger-ui"></div>
+    <script src="/swagger-ui/swagger-ui-bundle.js"></script>
+    <script src="/swagger-ui/swagger-ui-standalone-preset.js"></script>
+    <script>
+      window.onload = () => {{
+        const ui = SwaggerUIBundle({{
+          url: "{openapi}",
+          dom_id: "#swagger-ui",
+          presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset],
+          layout: "BaseLayout"
+        }});
+        window.ui = ui;
+      }};
+    </script>
+  </body>
+</html>
+"""
+
+
+_NON_WORD_RE = re.compile(r"\W+")
+_PATH_SEP_RE = re.compile(r"[\\/]")
+
 
 class _AccessLogExcludePathsFilter(logging.Filter):
     def __init__(self, excluded_paths: set[str]):
         super().__init__()
-        self._excluded_paths = excluded_paths
+        self._excluded_paths = frozenset(excluded_paths)
+        alternation = "|".join(
+            re.escape(path) for path in sorted(self._excluded_paths)
+        )
+        self._message_re = (
+            re.compile(f'"(?:GET|HEAD) (?:{alternation}) ')
+            if alternation
+            else None
+        )
 
     def filter(self, record: logging.LogRecord) -> bool:
         request_line = getattr(record, "request_line", None)
@@ -64,11 +155,9 @@ class _AccessLogExcludePathsFilter(logging.Filter):
                 if path in self._excluded_paths:
                     return False
 
-        message = record.getMessage()
-        for path in self._excluded_paths:
-            if f" {path} " in message or f'"GET {path} ' in message:
-                return False
-        return True
+        if self._message_re is None:
+            return True
+        return self._message_re.search(record.getMessage()) is None
 
 
 def _install_uvicorn_access_log_filter() -> None:
@@ -82,45 +171,28 @@ def _install_uvicorn_access_log_filter() -> None:
     setattr(logger, marker, True)
 
 
-def _get_env_int(name: str) -> int | None:
-    raw = os.getenv(name)
-    if raw is None or not raw.strip():
-        return None
-    return int(raw)
-
+def _get_env_workers(
+    name: str, env: Mapping[str, str] | None = None
+) -> int:
+    # "auto" runs one worker per CPU; unset or empty keeps one process.
+    raw = (os.environ if env is None else env).get(name, "").strip()
+    if raw.lower() == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(raw)) if raw else 1
 
-def _get_env_float(name: str) -> float | None:
-    raw = os.getenv(name)
-    if raw is None or not raw.strip():
-        return None
-    return float(raw)
 
-
-def _get_env_bool(name: str) -> bool | None:
-    raw = os.getenv(name)
-    if raw is None or not raw.strip():
-        return None
-    raw = raw.strip().lower()
-    if raw in {"1", "true", "yes", "y", "on"}:
-        return True
-    if raw in {"0", "false", "no", "n", "off"}:
-        return False
-    raise ValueError(f"Invalid bool env var {name}={raw!r}")
-
-
-def _get_env_bool_default(name: str, default: bool) -> bool:
-    value = _get_env_bool(name)
-    return default if value is None else value
-
-
-def _get_env_list(name: str) -> list[str]:
-    raw = os.getenv(name, "")
-    if not raw.strip():
-        return []
-    return [item.strip() for item in raw.split(",") if item.strip()]
+def _get_env_metrics_cache_s(env: Mapping[str, str] | None = None) -> float:
+    # Unset keeps the default window; 0 renders /metrics on every scrape.
+    value = get_env_float("SERVICE_METRICS_CACHE_S", env)
+    if value is None:
+        return _DEFAULT_METRICS_CACHE_S
+    return max(0.0, value)
 
 
 def _normalize_path(path: str | None, fallback: str) -> str:
+    # Common case: already "/..." with no surrounding whitespace.
+    if path and path[0] == "/" and not path[-1].isspace():
+        return path
     if not path or not path.strip():
         return fallback
     path = path.strip()
@@ -129,36 +201,166 @@ def _normalize_path(path: str | None, fallback: str) -> str:
     return path
 
 
-def _get_env_path(name: str) -> Path | None:
-    raw = os.getenv(name)
+def _get_env_path(
+    name: str, env: Mapping[str, str] | None = None
+) -> Path | None:
+    raw = (os.environ if env is None else env).get(name)
     if raw is None:
         return None
     raw = raw.strip()
     if not raw:
         return None
-    return Path(raw).expanduser()
+    return _to_path(raw)
+
+
+def _to_path(text: str) -> Path:
+    # expanduser() allocates a second Path; only "~" paths need it.
+    path = Path(text)
+    return path.expanduser() if text[:1] == "~" else path
+
+
+_DEFAULT_BATCH_MAX_SIZE = 64
+_DEFAULT_METRICS_CACHE_S = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class _EnvSnapshot:
+    """Service environment settings, parsed in a single pass over environ."""
+
+    bind_host: str
+    port: int
+    workers: int
+    access_log_enabled: bool
+    proxy_headers_enabled: bool
+    backlog: int | None
+    limit_concurrency: int | None
+    keepalive_s: int | None
+    algo_modules: list[str]
+    algo_module_dir: str | None
+    algo_metadata_config_dir: str | None
+    swagger_enabled: bool
+    swagger_path: str
+    swagger_offline: bool
+    swagger_static_dir: Path | None
+    cors_enabled: bool
+    cors_allow_origins: list[str]
+    cors_allow_origin_regex: str | None
+    cors_allow_methods: list[str]
+    cors_allow_headers: list[str]
+    cors_allow_credentials: bool
+    gzip_enabled: bool
+    admin_enabled: bool
+    executor_global_max_workers: int | None
+    executor_global_queue_size: int | None
+    executor_kill_tree: bool | None
+    executor_kill_grace_s: float | None
+    thread_pool_size: int | None
+    batch_max_size: int
+    batch_concurrency: int
+    metrics_cache_s: float
+
+    @classmethod
+    def from_env(
+        cls, env: Mapping[str, str] | None = None
+    ) -> "_EnvSnapshot":
+        env = os.environ.copy() if env is None else env
+        return cls(
+            bind_host=env.get("SERVICE_BIND_HOST", "127.0.0.1"),
+            port=get_env_int("SERVICE_PORT", env) or 8000,
+            workers=_get_env_workers("SERVICE_WORKERS", env),
+            access_log_enabled=get_env_bool_default(
+                "SERVICE_ACCESS_LOG_ENABLED", True, env
+            ),
+            proxy_headers_enabled=get_env_bool_default(
+                "SERVICE_PROXY_HEADERS_ENABLED", True, env
+            ),
+            backlog=get_env_int("SERVICE_BACKLOG", env),
+            limit_concurrency=get_env_int("SERVICE_LIMIT_CONCURRENCY", env),
+            keepalive_s=get_env_int("SERVICE_KEEPALIVE_S", env),
+            algo_modules=get_env_list("ALGO_MODULES", env),
+            algo_module_dir=env.get("ALGO_MODULE_DIR", "").strip() or None,
+            algo_metadata_config_dir=(
+                env.get("ALGO_METADATA_CONFIG_DIR", "").strip() or None
+            ),
+            swagger_enabled=get_env_bool_default(
+                "SERVICE_SWAGGER_ENABLED", True, env
+            ),
+            swagger_path=_normalize_path(
+                env.get("SERVICE_SWAGGER_PATH", "/docs"), "/docs"
+            ),
+            swagger_offline=get_env_bool_default(
+                "SERVICE_SWAGGER_OFFLINE", False, env
+            ),
+            swagger_static_dir=_get_env_path(
+                "SERVICE_SWAGGER_STATIC_DIR", env
+            ),
+            cors_enabled=get_env_bool_default("CORS_ENABLED", False, env),
+            cors_allow_origins=get_env_list("CORS_ALLOW_ORIGINS", env),
+            cors_allow_origin_regex=(
+                env.get("CORS_ALLOW_ORIGIN_REGEX", "").strip() or None
+            ),
+            cors_allow_methods=(
+                get_env_list("CORS_ALLOW_METHODS", env) or ["*"]
+            ),
+            cors_allow_headers=(
+                get_env_list("CORS_ALLOW_HEADERS", env) or ["*"]
+            ),
+            cors_allow_credentials=get_env_bool_default(
+                "CORS_ALLOW_CREDENTIALS", False, env
+            ),
+            gzip_enabled=get_env_bool_default(
+                "SERVICE_GZIP_ENABLED", True, env
+            ),
+            admin_enabled=get_env_bool_default(
+                "SERVICE_ADMIN_ENABLED", False, env
+            ),
+            executor_global_max_workers=get_env_int(
+                "EXECUTOR_GLOBAL_MAX_WORKERS", env
+            ),
+            executor_global_queue_size=get_env_int(
+                "EXECUTOR_GLOBAL_QUEUE_SIZE", env
+            ),
+            executor_kill_tree=get_env_bool("EXECUTOR_KILL_TREE", env),
+            executor_kill_grace_s=get_env_float(
+                "EXECUTOR_KILL_GRACE_S", env
+            ),
+            thread_pool_size=get_env_int("SERVICE_THREAD_POOL_SIZE", env),
+            batch_max_size=(
+                get_env_int("SERVICE_BATCH_MAX_SIZE", env)
+                or _DEFAULT_BATCH_MAX_SIZE
+            ),
+            batch_concurrency=(
+                get_env_int("SERVICE_BATCH_CONCURRENCY", env) or 1
+            ),
+            metrics_cache_s=_get_env_metrics_cache_s(env),
+        )
 
 
-def _resolve_swagger_static_dir() -> Path:
-    env_path = _get_env_path("SERVICE_SWAGGER_STATIC_DIR")
+def _resolve_swagger_static_dir(
+    settings: _EnvSnapshot | None = None,
+) -> Path:
+    env_path = (
+        _get_env_path("SERVICE_SWAGGER_STATIC_DIR")
+        if settings is None
+        else settings.swagger_static_dir
+    )
     if env_path is not None:
         return env_path
-    return Path.cwd() / "assets" / "swagger-ui"
+    return Path.cwd().joinpath("assets", "swagger-ui")
 
 
 def _resolve_env_path(env_path: str | os.PathLike[str] | None) -> Path | None:
-    if env_path is not None:
-        env_text = str(env_path).strip()
-        if env_text:
-            return Path(env_text).expanduser()
-        return None
-    env_text = os.getenv("SERVICE_ENV_PATH", "").strip()
-    if env_text:
-        return Path(env_text).expanduser()
-    return Path.cwd() / ".env"
+    if env_path is None:
+        env_text = os.getenv("SERVICE_ENV_PATH", "").strip()
+        return _to_path(env_text) if env_text else Path.cwd() / ".env"
+    env_text = os.fspath(env_path).strip()
+    return _to_path(env_text) if env_text else None
 
 
 def _load_env_file(env_path: str | os.PathLike[str] | None) -> None:
+    # Imported lazily: only run() needs dotenv, not create_app() users.
+    from dotenv import load_dotenv
+
     resolved = _resolve_env_path(env_path)
     if resolved is None:
         load_dotenv()
@@ -169,36 +371,61 @@ def _load_env_file(env_path: str | os.PathLike[str] | None) -> None:
     load_dotenv()
 
 
-def _build_executor_from_env() -> DispatchingExecutor:
-    global_max_workers = _get_env_int("EXECUTOR_GLOBAL_MAX_WORKERS")
-    global_queue_size = _get_env_int("EXECUTOR_GLOBAL_QUEUE_SIZE")
-    global_kill_tree = _get_env_bool("EXECUTOR_KILL_TREE")
-    global_kill_grace_s = _get_env_float("EXECUTOR_KILL_GRACE_S")
+def _build_executor_from_env(
+    settings: _EnvSnapshot | None = None,
+) -> DispatchingExecutor:
+    if settings is None:
+        settings = _EnvSnapshot.from_env()
 
     kwargs: dict[str, object] = {}
-    if global_max_workers is not None:
-        kwargs["global_max_workers"] = global_max_workers
-    if global_queue_size is not None:
-        kwargs["global_queue_size"] = global_queue_size
-    if global_kill_tree is not None:
-        kwargs["global_kill_tree"] = global_kill_tree
-    if global_kill_grace_s is not None:
-        kwargs["global_kill_grace_s"] = global_kill_grace_s
+    if settings.executor_global_max_workers is not None:
+        kwargs["global_max_workers"] = settings.executor_global_max_workers
+    if settings.executor_global_queue_size is not None:
+        kwargs["global_queue_size"] = settings.executor_global_queue_size
+    if settings.executor_kill_tree is not None:
+        kwargs["global_kill_tree"] = settings.executor_kill_tree
+    if settings.executor_kill_grace_s is not None:
+        kwargs["global_kill_grace_s"] = settings.executor_kill_grace_s
 
     return DispatchingExecutor(**kwargs)  # type: ignore[arg-type]
 
 
+_ExecutionConverter = Callable[[object], dict[str, object]]
+
+# Per-type converters, chosen once on first sight of each execution type.
+_EXECUTION_CONVERTERS: dict[type, _ExecutionConverter] = {}
+
+
 def _execution_to_dict(execution: object) -> dict[str, object]:
-    payload: dict[str, object] = {}
-    if hasattr(execution, "__dataclass_fields__"):
-        payload = asdict(execution)  # type: ignore[arg-type]
-    elif hasattr(execution, "__dict__"):
-        payload = dict(execution.__dict__)  # type: ignore[attr-defined]
+    cls = type(execution)
+    converter = _EXECUTION_CONVERTERS.get(cls)
+    if converter is None:
+        converter = _build_execution_converter(cls)
+        _EXECUTION_CONVERTERS[cls] = converter
+    return converter(execution)
+
+
+def _build_execution_converter(cls: type) -> _ExecutionConverter:
+    if hasattr(cls, "__dataclass_fields__"):
+        # Shallow copy: execution configs hold only scalars and enums.
+        names = tuple(f.name for f in fields(cls))
+
+        def _from_fields(execution: object) -> dict[str, object]:
+            return {
+                name: _enum_value(getattr(execution, name)) for name in names
+            }
 
-    for key, value in list(payload.items()):
-        if isinstance(value, Enum):
-            payload[key] = value.value
-    return payload
+        return _from_fields
+
+    def _from_vars(execution: object) -> dict[str, object]:
+        attrs: dict[str, object] = getattr(execution, "__dict__", {})
+        return {key: _enum_value(value) for key, value in attrs.items()}
+
+    return _from_vars
+
+
+def _enum_value(value: object) -> object:
+    return value.value if isinstance(value, Enum) else value
 
 
 _CAMEL_SKIP_VALUE_KEYS = {
@@ -231,41 +458,55 @@ def _camelize_payload(value: object) -> object:
 
 
 def _split_module_spec(module_spec: str) -> tuple[str, str | None]:
-    if ":" not in module_spec:
+    module_path, sep, attr = module_spec.rpartition(":")
+    if not sep:
         return module_spec, None
+    # A lone drive letter ("C:\\..." / "C:/...") means there is no attr.
     if (
-        len(module_spec) > 2
-        and module_spec[1] == ":"
-        and module_spec[2:3] in {"\\", "/"}
+        len(module_path) == 1
+        and module_path.isascii()
+        and module_path.isalpha()
+        and attr[:1] in ("\\", "/")
     ):
-        last_colon = module_spec.rfind(":")
-        if last_colon == 1:
-            return module_spec, None
-        module_path = module_spec[:last_colon].strip()
-        index: int = last_colon + 1
-        attr = module_spec[index:].strip()
-        return module_path, attr or None
-    module_path, attr = module_spec.rsplit(":", 1)
-    module_path = module_path.strip()
-    attr = attr.strip()
-    return module_path, attr or None
+        return module_spec, None
+    return module_path.strip(), attr.strip() or None
 
 
 def _is_filesystem_path(module_path: str) -> bool:
-    path = Path(module_path)
-    if path.is_absolute() or path.exists():
+    # Cheap lexical checks first; only bare names need a stat.
+    if _PATH_SEP_RE.search(module_path) is not None:
         return True
-    if path.suffix == ".py":
+    path = Path(module_path)
+    if path.is_absolute() or path.suffix == ".py":
         return True
-    return "\\" in module_path or "/" in module_path
+    return path.exists()
 
 
 def _make_module_name(path: Path) -> str:
-    stem = re.sub(r"\W+", "_", path.stem)
-    digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:8]
+    stem = _NON_WORD_RE.sub("_", path.stem)
+    digest = hashlib.blake2b(
+        str(path).encode("utf-8"), digest_size=4
+    ).hexdigest()
     return f"algo_dynamic_{stem}_{digest}"
 
 
+# Upper bound on threads used to import ALGO_MODULES concurrently.
+_MODULE_LOAD_WORKERS = 8
+
+def _cached_import(module_name: str) -> ModuleType:
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    return importlib.import_module(module_name)
+
+
+def _stat_module_path(path: Path) -> os.stat_result:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No module at {path}") from None
+
+
 def _load_module_from_path(path: Path) -> ModuleType:
     spec = importlib.util.spec_from_file_location(
         _make_module_name(path), path
@@ -279,68 +520,192 @@ def _load_module_from_path(path: Path) -> ModuleType:
 
 
 def load_algorithm_modules(modules: List[str]) -> list[ModuleType]:
-    """Import modules or file paths to trigger algorithm registration."""
-    loaded: list[ModuleType] = []
-    for module_spec in modules:
-        if not module_spec:
-            continue
-        try:
-            module_path, attr = _split_module_spec(module_spec)
-            module: ModuleType
-            if _is_filesystem_path(module_path):
-                path = Path(module_path)
-                if not path.is_absolute():
-                    path = (Path.cwd() / path).resolve()
-                if path.is_dir():
-                    path = path / "__init__.py"
-                if not path.exists():
-                    raise FileNotFoundError(f"No module at {path}")
-                module = _load_module_from_path(path)
-            else:
-                module = importlib.import_module(module_path)
-            if attr:
-                getattr(module, attr)
-            loaded.append(module)
-            _EVENT_LOGGER.info(
-                "Loaded algorithm module: %s",
-                module_spec,
-                logger=_LOGGER,
-            )
-        except Exception:
-            _EVENT_LOGGER.exception(
-                "Failed to load module %s",
-                module_spec,
-                logger=_LOGGER,
-            )
-    return loaded
+    """Import modules or file paths to trigger algorithm registration.
+
+    Modules are imported on a small thread pool so their file I/O
+    overlaps; set ``ALGO_MODULES_SEQUENTIAL=true`` to import one by one.
+    The result keeps the order of ``modules``.
+    """
+    specs = [module_spec for module_spec in modules if module_spec]
+    if len(specs) > 1 and not get_env_bool_default(
+        "ALGO_MODULES_SEQUENTIAL", False
+    ):
+        with ThreadPoolExecutor(
+            max_workers=min(_MODULE_LOAD_WORKERS, len(specs)),
+            thread_name_prefix="algo-module-loader",
+        ) as pool:
+            results = list(pool.map(_load_algorithm_module, specs))
+    else:
+        results = [_load_algorithm_module(spec) for spec in specs]
+    return [module for module in results if module is not None]
+
+
+def _load_algorithm_module(module_spec: str) -> ModuleType | None:
+    try:
+        module_path, attr = _split_module_spec(module_spec)
+        module: ModuleType
+        if _is_filesystem_path(module_path):
+            path = Path(os.path.abspath(module_path))
+            st = _stat_module_path(path)
+            if stat.S_ISDIR(st.st_mode):
+                path = path / "__init__.py"
+                _stat_module_path(path)
+            module = _load_module_from_path(path)
+        else:
+            module = _cached_import(module_path)
+        if attr:
+            getattr(module, attr)
+    except Exception:
+        _EVENT_LOGGER.exception(
+            "Failed to load module %s",
+            module_spec,
+            logger=_LOGGER,
+        )
+        return None
+    _EVENT_LOGGER.info(
+        "Loaded algorithm module: %s",
+        module_spec,
+        logger=_LOGGER,
+    )
+    return module
+
+
+# /readyz 503 bodies, one per state, so probes never serialize per request.
+# No TTL cache: a draining pod has to drop out of readiness immediately.
+_NOT_READY_BODIES: dict[ServiceState, bytes] = {
+    state: _encode_json({"status": "not_ready", "state": state.value})
+    for state in ServiceState
+}
+
+
+def _utc_now_iso() -> str:
+    # Same shape pydantic emits for UTC datetimes in JSON mode.
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
 
+_DATETIME_SLOT = "__datetime_slot__"
 
-def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
+
+def _success_envelope_parts(data: object) -> tuple[bytes, bytes]:
+    """Serialize a success envelope around its per-response datetime.
+
+    Returns the bytes before and after the datetime value, so callers can
+    emit a fresh timestamp without re-encoding ``data``.
+    """
+    envelope = api_success(data=data).model_dump(by_alias=True, mode="json")
+    envelope["datetime"] = _DATETIME_SLOT
+    body = _encode_json(envelope)
+    # "datetime" precedes "data", so the first match is the slot itself.
+    head, tail = body.split(f'"{_DATETIME_SLOT}"'.encode("ascii"), 1)
+    return head + b'"', b'"' + tail
+
+
+_REQUEST_ID_SLOT = "__request_id_slot__"
+
+# (status code, (head, middle, tail)) around the requestId and datetime.
+_RejectionEnvelope = tuple[int, tuple[bytes, bytes, bytes]]
+
+
+def _build_rejection_envelopes() -> dict[ServiceState, _RejectionEnvelope]:
+    """Pre-serialize the "not accepting requests" envelope per state.
+
+    Each envelope is split around its requestId and datetime values, which
+    are the only parts that vary per rejected request.
+    """
+    envelopes: dict[ServiceState, _RejectionEnvelope] = {}
+    for state in ServiceState:
+        status_code = 429 if state is ServiceState.DRAINING else 503
+        envelope = api_error(
+            code=status_code,
+            message=f"service not accepting requests: {state.value}",
+        )
+        payload = _camelize_payload(
+            envelope.model_dump(by_alias=True, mode="json")
+        )
+        payload["requestId"] = _REQUEST_ID_SLOT  # type: ignore[index]
+        payload["datetime"] = _DATETIME_SLOT  # type: ignore[index]
+        body = _encode_json(payload)
+        head, rest = body.split(f'"{_REQUEST_ID_SLOT}"'.encode("ascii"), 1)
+        middle, tail = rest.split(f'"{_DATETIME_SLOT}"'.encode("ascii"), 1)
+        envelopes[state] = (status_code, (head, middle + b'"', b'"' + tail))
+    return envelopes
+
+
+_REJECTION_ENVELOPES = _build_rejection_envelopes()
+
+
+def _algorithm_listing(reg: AlgorithmRegistry) -> object:
+    data = [
+        {
+            "name": s.name,
+            "display_name": s.display_name or s.name,
+            "version": s.version,
+            "description": s.description,
+            "algorithm_type": s.algorithm_type.value,
+            "created_time": s.created_time,
+            "author": s.author,
+            "category": s.category,
+            "application_scenarios": s.application_scenarios,
+            "extra": s.extra,
+        }
+        for s in reg.list()
+    ]
+    return _camelize_payload(data)
+
+
+def _schema_payload(spec: AlgorithmSpec) -> object:
+    hyper_schema = spec.hyperparams_schema()
+    hyper_fields = spec.hyperparams_fields()
+    hyperparams = None
+    if hyper_schema is not None:
+        hyperparams = {
+            "schema": hyper_schema,
+            "fields": hyper_fields or [],
+        }
+    return _camelize_payload(
+        {
+            "input": spec.input_schema(),
+            "output": spec.output_schema(),
+            "execution": _execution_to_dict(spec.execution),
+            "algorithm_type": spec.algorithm_type.value,
+            "hyperparams": hyperparams,
+            "display_name": spec.display_name or spec.name,
+            "created_time": spec.created_time,
+            "author": spec.author,
+            "category": spec.category,
+            "application_scenarios": spec.application_scenarios,
+            "extra": spec.extra,
+        }
+    )
+
+
+def create_app(
+    registry: Optional[AlgorithmRegistry] = None,
+    *,
+    settings: _EnvSnapshot | None = None,
+) -> FastAPI:
     """Create and configure the FastAPI application."""
     reg = registry or get_registry()
+    if settings is None:
+        settings = _EnvSnapshot.from_env()
 
     bundle = build_service_runtime(
         registry=reg,
-        executor=_build_executor_from_env(),
+        executor=_build_executor_from_env(settings),
     )
     service = bundle.service
     runtime = bundle.runtime
     metrics_store = bundle.metrics
-    swagger_enabled = _get_env_bool_default("SERVICE_SWAGGER_ENABLED", True)
-    swagger_docs_path = _normalize_path(
-        os.getenv("SERVICE_SWAGGER_PATH", "/docs"),
-        "/docs",
-    )
-    swagger_offline_enabled = _get_env_bool_default(
-        "SERVICE_SWAGGER_OFFLINE", False
-    )
+    swagger_enabled = settings.swagger_enabled
+    swagger_docs_path = settings.swagger_path
+    swagger_offline_enabled = settings.swagger_offline
     docs_url = swagger_docs_path if swagger_enabled else None
     openapi_url = "/openapi.json" if swagger_enabled else None
     redoc_url = "/redoc" if swagger_enabled else None
     swagger_static_dir: Path | None = None
     use_offline_swagger = False
     if swagger_enabled and swagger_offline_enabled:
-        swagger_static_dir = _resolve_swagger_static_dir()
+        swagger_static_dir = _resolve_swagger_static_dir(settings)
         if swagger_static_dir.exists():
             docs_url = None
             redoc_url = None
@@ -356,6 +721,14 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         app.state.runtime = runtime
+        if settings.thread_pool_size is not None:
+            # invoke_async blocks one of these threads per in-flight call.
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(
+                    max_workers=settings.thread_pool_size,
+                    thread_name_prefix="algo-invoke",
+                )
+            )
         try:
             _install_uvicorn_access_log_filter()
             await runtime.provisioning(reason="startup")
@@ -371,6 +744,7 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
     app = FastAPI(
         title="Algorithm Service",
         lifespan=lifespan,
+        default_response_class=_FastJSONResponse,
         docs_url=docs_url,
         openapi_url=openapi_url,
         redoc_url=redoc_url,
@@ -383,47 +757,21 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
             name="swagger-ui",
         )
 
+        swagger_html = _SWAGGER_UI_HTML_TEMPLATE.format(
+            title=app.title,
+            openapi=openapi_url or "/openapi.json",
+        ).encode("utf-8")
+
         @app.get(swagger_docs_path, include_in_schema=False)
         async def swagger_ui_html():
-            openapi = openapi_url or "/openapi.json"
-            html = f"""<!DOCTYPE html>
-<html>
-  <head>
-    <meta charset="utf-8" />
-    <title>{app.title} - Swagger UI</title>
-    <link rel="stylesheet" href="/swagger-ui/swagger-ui.css" />
-    <link rel="icon" href="/swagger-ui/favicon.png" />
-  </head>
-  <body>
-    <div id="swagger-ui"></div>
-    <script src="/swagger-ui/swagger-ui-bundle.js"></script>
-    <script src="/swagger-ui/swagger-ui-standalone-preset.js"></script>
-    <script>
-      window.onload = () => {{
-        const ui = SwaggerUIBundle({{
-          url: "{openapi}",
-          dom_id: "#swagger-ui",
-          presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset],
-          layout: "BaseLayout"
-        }});
-        window.ui = ui;
-      }};
-    </script>
-  </body>
-</html>
-"""
-            return HTMLResponse(html)
+            return HTMLResponse(swagger_html)
 
-    if _get_env_bool_default("CORS_ENABLED", False):
-        allow_origins = _get_env_list("CORS_ALLOW_ORIGINS")
-        allow_origin_regex = (
-            os.getenv("CORS_ALLOW_ORIGIN_REGEX", "").strip() or None
-        )
-        allow_methods = _get_env_list("CORS_ALLOW_METHODS") or ["*"]
-        allow_headers = _get_env_list("CORS_ALLOW_HEADERS") or ["*"]
-        allow_credentials = _get_env_bool_default(
-            "CORS_ALLOW_CREDENTIALS", False
-        )
+    if settings.cors_enabled:
+        allow_origins = list(settings.cors_allow_origins)
+        allow_origin_regex = settings.cors_allow_origin_regex
+        allow_methods = settings.cors_allow_methods
+        allow_headers = settings.cors_allow_headers
+        allow_credentials = settings.cors_allow_credentials
 
         if not allow_origins and not allow_origin_regex:
             allow_origins = ["*"]
@@ -443,62 +791,93 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
             allow_headers=allow_headers,
         )
 
-    admin_enabled = _get_env_bool("SERVICE_ADMIN_ENABLED") or False
+    if settings.gzip_enabled:
+        # Probe bodies stay under minimum_size; /metrics and the catalog
+        # routes compress well. Level 1 keeps the CPU cost low.
+        app.add_middleware(
+            GZipMiddleware, minimum_size=1024, compresslevel=1
+        )
+
+    admin_enabled = settings.admin_enabled
 
-    @app.get("/", include_in_schema=False)
     async def root():
         return RedirectResponse(url="/healthz", status_code=307)
 
-    @app.get("/healthz")
     async def healthz():
         """Liveness probe."""
-        return _camelize_payload({"status": "ok"})
+        return Response(content=_HEALTHZ_BODY, media_type=_JSON_MEDIA_TYPE)
 
-    @app.get("/readyz")
     async def readyz():
         """Readiness probe."""
-        service_runtime: ServiceLifecycleProtocol | None = getattr(
-            app.state, "runtime", None
-        )
-        if service_runtime is None or not service_runtime.accepting_requests:
-            state = (
-                service_runtime.state.value if service_runtime else "Unknown"
-            )
-            return JSONResponse(
+        if not runtime.accepting_requests:
+            return Response(
+                content=_NOT_READY_BODIES[runtime.state],
                 status_code=503,
-                content=_camelize_payload(
-                    {"status": "not_ready", "state": state}
-                ),
+                media_type=_JSON_MEDIA_TYPE,
             )
-        return _camelize_payload({"status": "ready"})
+        return Response(content=_READYZ_BODY, media_type=_JSON_MEDIA_TYPE)
+
+    # (rendered_at, body) of the last scrape, reused for metrics_cache_s so
+    # several scrapers share one render. Rendering never awaits, so
+    # concurrent scrapes cannot interleave between the check and the store.
+    metrics_cache_s = settings.metrics_cache_s
+    metrics_cache: tuple[float, bytes] | None = None
 
-    @app.get("/metrics")
     async def metrics():
         """Prometheus metrics endpoint."""
-        return PlainTextResponse(metrics_store.render_prometheus_text())
+        nonlocal metrics_cache
+        now = time.monotonic()
+        if metrics_cache is None or now - metrics_cache[0] >= metrics_cache_s:
+            metrics_cache = (now, metrics_store.render_prometheus_bytes())
+        return Response(
+            content=metrics_cache[1],
+            media_type=_PROMETHEUS_MEDIA_TYPE,
+        )
+
+    # Probe routes return ready-made responses, so register them in one pass
+    # with response_model=None to skip FastAPI's response-model inference.
+    probe_routes: tuple[
+        tuple[str, Callable[[], Awaitable[Response]], bool], ...
+    ] = (
+        ("/", root, False),
+        ("/healthz", healthz, True),
+        ("/readyz", readyz, True),
+        ("/metrics", metrics, True),
+    )
+    for path, endpoint, include_in_schema in probe_routes:
+        app.add_api_route(
+            path,
+            endpoint,
+            methods=["GET"],
+            response_model=None,
+            include_in_schema=include_in_schema,
+        )
 
-    @app.get("/algorithms")
-    async def list_algorithms():
+    # (registry version, envelope head, envelope tail) rebuilt only after
+    # registry mutations; each response just splices in the datetime.
+    algorithms_cache: tuple[int, bytes, bytes] | None = None
+
+    # Pre-encoded envelope routes document their body shape via
+    # ``responses`` only; a response_model would never be applied to them.
+    envelope_docs: dict[int | str, dict[str, Any]] = {
+        200: {"model": AlgorithmResponse}
+    }
+
+    @app.get("/algorithms", responses=envelope_docs)
+    async def list_algorithms() -> Response:
         """List all registered algorithms."""
-        specs = reg.list()
-        data = [
-            {
-                "name": s.name,
-                "display_name": s.display_name or s.name,
-                "version": s.version,
-                "description": s.description,
-                "algorithm_type": s.algorithm_type.value,
-                "created_time": s.created_time,
-                "author": s.author,
-                "category": s.category,
-                "application_scenarios": s.application_scenarios,
-                "extra": s.extra,
-            }
-            for s in specs
-        ]
-        return api_success(data=_camelize_payload(data))
+        nonlocal algorithms_cache
+        version = reg.version
+        if algorithms_cache is None or algorithms_cache[0] != version:
+            head, tail = _success_envelope_parts(_algorithm_listing(reg))
+            algorithms_cache = (version, head, tail)
+        _, head, tail = algorithms_cache
+        return Response(
+            content=head + _utc_now_iso().encode("ascii") + tail,
+            media_type=_JSON_MEDIA_TYPE,
+        )
 
-    @app.get("/service/info")
+    @app.get("/service/info", response_model=AlgorithmResponse)
     async def service_info():
         """Describe the current service instance and its algorithms."""
         registry_config = load_registry_config()
@@ -517,40 +896,36 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
         }
         return api_success(data=_camelize_payload(data))
 
-    @app.get("/algorithms/{name}/{version}/schema")
-    async def get_schema(name: str, version: str):
+    # (name, version) -> envelope head/tail; cleared on registry mutation.
+    schema_cache: dict[tuple[str, str], tuple[bytes, bytes]] = {}
+    schema_cache_version = reg.version
+
+    @app.get("/algorithms/{name}/{version}/schema", responses=envelope_docs)
+    async def get_schema(name: str, version: str) -> Response:
         """Get input/output schema for an algorithm."""
-        try:
-            spec = reg.get(name, version)
-            hyper_schema = spec.hyperparams_schema()
-            hyper_fields = spec.hyperparams_fields()
-            hyperparams = None
-            if hyper_schema is not None:
-                hyperparams = {
-                    "schema": hyper_schema,
-                    "fields": hyper_fields or [],
-                }
-            return api_success(
-                data=_camelize_payload(
-                    {
-                        "input": spec.input_schema(),
-                        "output": spec.output_schema(),
-                        "execution": _execution_to_dict(spec.execution),
-                        "algorithm_type": spec.algorithm_type.value,
-                        "hyperparams": hyperparams,
-                        "display_name": spec.display_name or spec.name,
-                        "created_time": spec.created_time,
-                        "author": spec.author,
-                        "category": spec.category,
-                        "application_scenarios": spec.application_scenarios,
-                        "extra": spec.extra,
-                    }
+        nonlocal schema_cache_version
+        if schema_cache_version != reg.version:
+            schema_cache.clear()
+            schema_cache_version = reg.version
+        parts = schema_cache.get((name, version))
+        if parts is None:
+            try:
+                spec = reg.get(name, version)
+                parts = _success_envelope_parts(_schema_payload(spec))
+            except Exception as e:
+                return _FastJSONResponse(
+                    content=api_error(code=404, message=str(e)).model_dump(
+                        by_alias=True, mode="json"
+                    )
                 )
-            )
-        except Exception as e:
-            return api_error(code=404, message=str(e))
+            schema_cache[(name, version)] = parts
+        head, tail = parts
+        return Response(
+            content=head + _utc_now_iso().encode("ascii") + tail,
+            media_type=_JSON_MEDIA_TYPE,
+        )
 
-    @app.get("/registry/algorithms")
+    @app.get("/registry/algorithms", response_model=AlgorithmResponse)
     async def list_registry_algorithms(
         prefix: str = "algo_services/",
         healthy_only: bool = True,
@@ -592,36 +967,73 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
             )
         )
 
+    def _rejection_response(request_id: str | None) -> Response:
+        status_code, (head, middle, tail) = _REJECTION_ENVELOPES[runtime.state]
+        return Response(
+            content=b"".join(
+                (
+                    head,
+                    _encode_json(request_id),
+                    middle,
+                    _utc_now_iso().encode("ascii"),
+                    tail,
+                )
+            ),
+            status_code=status_code,
+            media_type=_JSON_MEDIA_TYPE,
+        )
+
+    batch_max_size = settings.batch_max_size
+    batch_concurrency = settings.batch_concurrency
+
+    @app.post("/algorithms/{name}/{version}/batch")
+    async def invoke_algorithm_batch(
+        name: str, version: str, requests: List[AlgorithmRequest]
+    ):
+        """Execute a batch of requests against one algorithm.
+
+        ``data`` holds one envelope per item, in input order.
+        """
+        if not runtime.accepting_requests:
+            return _rejection_response(None)
+        if len(requests) > batch_max_size:
+            return api_error(
+                code=413,
+                message=(
+                    f"batch size {len(requests)} exceeds limit "
+                    f"{batch_max_size}"
+                ),
+            )
+        try:
+            responses = await service.invoke_batch_async(
+                name, version, requests, concurrency=batch_concurrency
+            )
+        except Exception as e:
+            return api_error(code=500, message=str(e))
+        # Camelize each item once; the bare envelope only has scalar
+        # fields, so its keys are converted without walking the items again.
+        envelope = {
+            to_camel(key): value
+            for key, value in api_success()
+            .model_dump(by_alias=True, mode="json")
+            .items()
+        }
+        envelope["data"] = [
+            _camelize_payload(response.model_dump(by_alias=True, mode="json"))
+            for response in responses
+        ]
+        return _FastJSONResponse(content=envelope)
+
     @app.post("/algorithms/{name}/{version}")
     async def invoke_algorithm(
         name: str, version: str, request: AlgorithmRequest
     ):
         """Execute a specific algorithm."""
-        service_runtime: ServiceLifecycleProtocol | None = getattr(
-            app.state, "runtime", None
-        )
-        if (
-            service_runtime is not None
-            and not service_runtime.accepting_requests
-        ):
-            state = service_runtime.state
-            status_code = 503
-            if state is ServiceState.DRAINING:
-                status_code = 429
-            envelope = api_error(
-                code=status_code,
-                message=f"service not accepting requests: {state.value}",
-                request_id=request.requestId,
-            )
-            return JSONResponse(
-                status_code=status_code,
-                content=_camelize_payload(
-                    envelope.model_dump(by_alias=True, mode="json")
-                ),
-            )
+        if not runtime.accepting_requests:
+            return _rejection_response(request.requestId)
         try:
-            response = service.invoke(name, version, request)
-            return JSONResponse(
+            response = await service.invoke_async(name, version, request)
+            return _FastJSONResponse(
                 content=_camelize_payload(
                     response.model_dump(by_alias=True, mode="json")
                 )
@@ -633,67 +1045,48 @@ def create_app(registry: Optional[AlgorithmRegistry] = None) -> FastAPI:
 
         @app.get("/admin/lifecycle/state")
         async def lifecycle_state():
-            service_runtime: ServiceLifecycleProtocol | None = getattr(
-                app.state, "runtime", None
-            )
-            if service_runtime is None:
-                return JSONResponse(
-                    status_code=503,
-                    content=_camelize_payload(
-                        {"status": "not_ready", "state": "Unknown"}
-                    ),
-                )
             return _camelize_payload(
                 {
-                    "state": service_runtime.state.value,
-                    "accepting_requests": (
-                        service_runtime.accepting_requests
-                    ),
+                    "state": runtime.state.value,
+                    "accepting_requests": runtime.accepting_requests,
                 }
             )
 
-        def _lifecycle_error(exc: Exception) -> JSONResponse:
+        def _lifecycle_error(exc: Exception) -> _FastJSONResponse:
             if isinstance(exc, (AlreadyInStateError, InvalidTransitionError)):
-                return JSONResponse(
+                return _FastJSONResponse(
                     status_code=409,
                     content={"error": type(exc).__name__, "message": str(exc)},
                 )
-            return JSONResponse(
+            return _FastJSONResponse(
                 status_code=500,
                 content={"error": type(exc).__name__, "message": str(exc)},
             )
 
-        @app.post("/admin/lifecycle/degraded")
-        async def lifecycle_degraded():
-            try:
-                await runtime.degraded(reason="admin")
-                return {"state": runtime.state.value}
-            except Exception as exc:
-                return _lifecycle_error(exc)
-
-        @app.post("/admin/lifecycle/draining")
-        async def lifecycle_draining():
-            try:
-                await runtime.draining(reason="admin")
-                return {"state": runtime.state.value}
-            except Exception as exc:
-                return _lifecycle_error(exc)
-
-        @app.post("/admin/lifecycle/running")
-        async def lifecycle_running():
-            try:
-                await runtime.running(reason="admin")
-                return {"state": runtime.state.value}
-            except Exception as exc:
-                return _lifecycle_error(exc)
-
-        @app.post("/admin/lifecycle/shutdown")
-        async def lifecycle_shutdown():
-            try:
-                await runtime.shutdown(reason="admin")
-                return {"state": runtime.state.value}
-            except Exception as exc:
-                return _lifecycle_error(exc)
+        def _make_lifecycle_handler(
+            transition: Callable[..., Awaitable[object]],
+        ) -> Callable[[], Awaitable[object]]:
+            async def handler():
+                try:
+                    await transition(reason="admin")
+                    return {"state": runtime.state.value}
+                except Exception as exc:
+                    return _lifecycle_error(exc)
+
+            return handler
+
+        for phase, transition in (
+            ("degraded", runtime.degraded),
+            ("draining", runtime.draining),
+            ("running", runtime.running),
+            ("shutdown", runtime.shutdown),
+        ):
+            app.add_api_route(
+                f"/admin/lifecycle/{phase}",
+                _make_lifecycle_handler(transition),
+                methods=["POST"],
+                name=f"lifecycle_{phase}",
+            )
 
     return app
 
@@ -707,37 +1100,120 @@ class Server:
 def run(*, env_path: str | os.PathLike[str] | None = None) -> None:
     """Start uvicorn server with configuration from environment."""
     _load_env_file(env_path)
+    settings = _EnvSnapshot.from_env()
+    if settings.workers > 1:
+        _check_multi_worker_settings()
     configure_sdk_logging()
 
-    bind_host = os.getenv("SERVICE_BIND_HOST", "127.0.0.1")
-    port = int(os.getenv("SERVICE_PORT", "8000"))
+    import uvicorn
 
-    # Load modules to register algorithms
-    modules_str = os.getenv("ALGO_MODULES", "")
-    if modules_str:
-        modules = load_algorithm_modules(
-            [m.strip() for m in modules_str.split(",")]
+    if settings.workers > 1:
+        # Each worker process imports the factory and loads algorithms
+        # itself; the .env values loaded above are inherited via environ.
+        uvicorn.run(
+            f"{__name__}:create_app_from_env",
+            factory=True,
+            workers=settings.workers,
+            **_uvicorn_options(settings),
         )
+        return
+
+    _load_algorithms_from_env(settings)
+    app = create_app(settings=settings)
+    uvicorn.run(app, **_uvicorn_options(settings))
+
+
+def _check_multi_worker_settings() -> None:
+    """Refuse settings whose side effects every worker would repeat.
+
+    Each worker runs the full lifespan, so all of them would register and
+    deregister the same Consul instance and share the same rotating log
+    files.
+    """
+    conflicts: list[str] = []
+    if load_registry_config().enabled:
+        conflicts.append("SERVICE_REGISTRY_ENABLED=true")
+    logging_settings = load_logging_settings()
+    for name, directory in (
+        ("LOG_ERROR_DIR", logging_settings.error_dir),
+        ("LOG_PAYLOAD_DIR", logging_settings.payload_dir),
+        ("LOG_GENERAL_DIR", logging_settings.general_dir),
+    ):
+        if directory:
+            conflicts.append(f"{name}={directory}")
+    if conflicts:
+        raise ValueError(
+            "SERVICE_WORKERS > 1 cannot be combined with "
+            + ", ".join(conflicts)
+            + "; disable service registration and set the LOG_*_DIR "
+            "variables to empty to log to the console only"
+        )
+
+
+def _uvicorn_options(settings: _EnvSnapshot) -> dict[str, object]:
+    options: dict[str, object] = {
+        "host": settings.bind_host,
+        "port": settings.port,
+        "access_log": settings.access_log_enabled,
+        "proxy_headers": settings.proxy_headers_enabled,
+        "loop": _uvicorn_loop(),
+        "http": _uvicorn_http(),
+        # Skip the "server: uvicorn" header on every response. The Date
+        # header stays on, as HTTP requires it from servers with a clock.
+        "server_header": False,
+    }
+    # Socket tuning falls back to uvicorn's own defaults when unset.
+    if settings.backlog is not None:
+        options["backlog"] = settings.backlog
+    if settings.limit_concurrency is not None:
+        options["limit_concurrency"] = settings.limit_concurrency
+    if settings.keepalive_s is not None:
+        options["timeout_keep_alive"] = settings.keepalive_s
+    return options
+
+
+def create_app_from_env() -> FastAPI:
+    """App factory for worker processes: load algorithms, then build."""
+    configure_sdk_logging()
+    settings = _EnvSnapshot.from_env()
+    _load_algorithms_from_env(settings)
+    return create_app(settings=settings)
+
+
+def _load_algorithms_from_env(settings: _EnvSnapshot) -> None:
+    # Load modules to register algorithms
+    if settings.algo_modules:
+        modules = load_algorithm_modules(settings.algo_modules)
         registry = get_registry()
         for module in modules:
             registry.register_from_module(module)
 
-    module_dir = os.getenv("ALGO_MODULE_DIR", "").strip()
-    if module_dir:
-        get_registry().load_packages_from_dir(module_dir)
+    if settings.algo_module_dir:
+        get_registry().load_packages_from_dir(settings.algo_module_dir)
 
-    config_dir = os.getenv("ALGO_METADATA_CONFIG_DIR", "").strip()
-    if config_dir:
+    if settings.algo_metadata_config_dir:
         try:
-            get_registry().load_config(config_dir)
+            get_registry().load_config(settings.algo_metadata_config_dir)
         except Exception:
             _EVENT_LOGGER.exception(
                 "Failed to load algorithm metadata overrides",
                 logger=_LOGGER,
             )
 
-    app = create_app()
-    uvicorn.run(app, host=bind_host, port=port)
+
+def _uvicorn_loop() -> str:
+    # uvloop ships with uvicorn[standard] but not on Windows.
+    if importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    _LOGGER.warning("uvloop not installed; using the asyncio event loop")
+    return "asyncio"
+
+
+def _uvicorn_http() -> str:
+    if importlib.util.find_spec("httptools") is not None:
+        return "httptools"
+    _LOGGER.warning("httptools not installed; using the h11 HTTP parser")
+    return "h11"
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Callable
+from datetime import datetime
+from threading import Lock
+from typing import Any, Callable, Hashable, Sequence
 
 from ...protocol.models import (
     AlgorithmRequest,
@@ -13,6 +16,7 @@ from ...protocol.models import (
 
 from ...core import (
     AlgorithmRegistry,
+    AlgorithmSpec,
     DispatchingExecutor,
     ExecutionError,
     ExecutionRequest,
@@ -32,6 +36,36 @@ ObservationErrorHook = Callable[
 ]
 
 
+def _never_saturated(_: AlgorithmSpec[Any, Any]) -> bool:
+    return False
+
+
+def _no_admission_limit(
+    _: AlgorithmSpec[Any, Any],
+) -> tuple[Hashable, int] | None:
+    return None
+
+
+# HTTP status for each ExecutionError.kind; unknown kinds map to 500.
+_ERROR_KIND_STATUS: dict[str, int] = {
+    "validation": 400,
+    "rejected": 429,
+    "timeout": 504,
+    "runtime": 500,
+    "system": 500,
+}
+
+
+def _noop_start(_: ExecutionRequest[Any, Any]) -> None:
+    return None
+
+
+def _noop_result(
+    _: ExecutionRequest[Any, Any], __: ExecutionResult[Any]
+) -> None:
+    return None
+
+
 @dataclass(slots=True)
 class ObservationHooks:
     """Optional hooks for metrics/tracing integration."""
@@ -61,7 +95,32 @@ class AlgorithmHttpService:
         self._registry = registry
         self._executor = executor or DispatchingExecutor()
         self._hooks = observation or ObservationHooks()
-        self._now = now_fn or (lambda: datetime.now(timezone.utc))
+        # Resolve optional hooks and the clock once, so invoke() calls them
+        # unconditionally instead of re-checking on every request.
+        self._on_start: ObservationStartHook = (
+            self._hooks.on_start or _noop_start
+        )
+        self._on_complete: ObservationCompleteHook = (
+            self._hooks.on_complete or _noop_result
+        )
+        self._on_error: ObservationErrorHook = (
+            self._hooks.on_error or _noop_result
+        )
+        # Executors without a saturation probe are always tried.
+        self._saturated: Callable[[AlgorithmSpec[Any, Any]], bool] = getattr(
+            self._executor, "saturated", _never_saturated
+        )
+        self._admission_limit: Callable[
+            [AlgorithmSpec[Any, Any]], tuple[Hashable, int] | None
+        ] = getattr(self._executor, "admission_limit", _no_admission_limit)
+        # Requests admitted per pool but not finished yet, counted before
+        # the thread hop: the executor's own count only moves once submit()
+        # runs, which a small thread pool can delay indefinitely.
+        self._admitted: dict[Hashable, int] = {}
+        self._admission_lock = Lock()
+        self._timestamp: Callable[[], float] = (
+            time.time if now_fn is None else lambda: now_fn().timestamp()
+        )
 
     def start(self) -> None:
         self._executor.start()
@@ -69,14 +128,125 @@ class AlgorithmHttpService:
     def shutdown(self) -> None:
         self._executor.shutdown()
 
-    def invoke(
+    async def invoke_async(
         self,
         name: str,
         version: str,
         request: AlgorithmRequest[Any],
     ) -> AlgorithmResponse[Any]:
+        """Run :meth:`invoke` in a worker thread.
+
+        ``invoke`` blocks until the executor returns, so awaiting this keeps
+        the event loop free to serve probes and other requests meanwhile.
+        When the executor is already at capacity the request is rejected
+        with 429 on the loop, without queueing for a thread.
+        """
+        spec = self._registry.get(name, version)
+        return await self._invoke_spec_async(spec, request)
+
+    async def invoke_batch_async(
+        self,
+        name: str,
+        version: str,
+        requests: Sequence[AlgorithmRequest[Any]],
+        *,
+        concurrency: int = 1,
+    ) -> list[AlgorithmResponse[Any]]:
+        """Run a batch of requests, at most ``concurrency`` at a time.
+
+        The algorithm is resolved once for the whole batch, so an unknown
+        name/version raises before anything runs. Per-item failures become
+        error envelopes; responses keep the input order. Keep
+        ``concurrency`` within the executor's queue capacity, otherwise the
+        surplus items are rejected like any other overflow.
+        """
         spec = self._registry.get(name, version)
-        exec_request = ExecutionRequest(
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(
+            request: AlgorithmRequest[Any],
+        ) -> AlgorithmResponse[Any]:
+            async with limit:
+                return await self._invoke_spec_async(spec, request)
+
+        responses = await asyncio.gather(
+            *(run(request) for request in requests)
+        )
+        return list(responses)
+
+    def invoke(
+        self,
+        name: str,
+        version: str,
+        request: AlgorithmRequest[Any],
+    ) -> AlgorithmResponse[Any]:
+        return self._invoke_spec(self._registry.get(name, version), request)
+
+    async def _invoke_spec_async(
+        self,
+        spec: AlgorithmSpec[Any, Any],
+        request: AlgorithmRequest[Any],
+    ) -> AlgorithmResponse[Any]:
+        if self._saturated(spec):
+            return self._reject_saturated(spec, request)
+        limit = self._admission_limit(spec)
+        if limit is None:
+            return await asyncio.to_thread(self._invoke_spec, spec, request)
+        pool, capacity = limit
+        with self._admission_lock:
+            admitted = self._admitted.get(pool, 0)
+            if admitted < capacity:
+                self._admitted[pool] = admitted + 1
+        if admitted >= capacity:
+            return self._reject_saturated(spec, request)
+        try:
+            return await asyncio.to_thread(self._invoke_spec, spec, request)
+        finally:
+            with self._admission_lock:
+                self._admitted[pool] -= 1
+
+    def _invoke_spec(
+        self,
+        spec: AlgorithmSpec[Any, Any],
+        request: AlgorithmRequest[Any],
+    ) -> AlgorithmResponse[Any]:
+        exec_request = self._build_exec_request(spec, request)
+        self._on_start(exec_request)
+        result: ExecutionResult[Any] = self._executor.submit(exec_request)
+        if result.ended_at is None:
+            result.ended_at = self._timestamp()
+        return self._to_response(spec, request, exec_request, result)
+
+    def _reject_saturated(
+        self,
+        spec: AlgorithmSpec[Any, Any],
+        request: AlgorithmRequest[Any],
+    ) -> AlgorithmResponse[Any]:
+        """Build the executor's "queue is full" rejection without a thread.
+
+        Observation hooks still fire, so rejections are counted the same as
+        those returned by ``submit``.
+        """
+        exec_request = self._build_exec_request(spec, request)
+        self._on_start(exec_request)
+        now = time.monotonic()
+        result = ExecutionResult[Any](
+            success=False,
+            error=ExecutionError(
+                kind="rejected", message="executor queue is full"
+            ),
+            started_at=now,
+            ended_at=now,
+            queue_wait_ms=0.0,
+        )
+        return self._to_response(spec, request, exec_request, result)
+
+    @staticmethod
+    def _build_exec_request(
+        spec: AlgorithmSpec[Any, Any],
+        request: AlgorithmRequest[Any],
+    ) -> ExecutionRequest[Any, Any]:
+        return ExecutionRequest(
             spec=spec,
             payload=request.data,
             hyperparams=request.hyperParams,
@@ -87,11 +257,13 @@ class AlgorithmHttpService:
             timeout_s=None,
         )
 
-        self._emit_start(exec_request)
-        result: ExecutionResult[Any] = self._executor.submit(exec_request)
-        if result.ended_at is None:
-            result.ended_at = self._now().timestamp()
-
+    def _to_response(
+        self,
+        spec: AlgorithmSpec[Any, Any],
+        request: AlgorithmRequest[Any],
+        exec_request: ExecutionRequest[Any, Any],
+        result: ExecutionResult[Any],
+    ) -> AlgorithmResponse[Any]:
         response_meta = result.response_meta
         response_context = (
             response_meta.context
@@ -100,7 +272,7 @@ class AlgorithmHttpService:
         )
 
         if result.success:
-            self._emit_complete(exec_request, result)
+            self._on_complete(exec_request, result)
             code = response_meta.code if response_meta else None
             message = response_meta.message if response_meta else None
             return api_success(
@@ -112,7 +284,7 @@ class AlgorithmHttpService:
                 message=message if message is not None else "success",
             )
 
-        self._emit_error(exec_request, result)
+        self._on_error(exec_request, result)
         error = result.error
         code, message = self._map_error(error)
         if response_meta is not None:
@@ -128,31 +300,10 @@ class AlgorithmHttpService:
             algorithm_name=spec.name,
         )
 
-    def _emit_start(self, exec_request: ExecutionRequest[Any, Any]) -> None:
-        if self._hooks.on_start is not None:
-            self._hooks.on_start(exec_request)
-
-    def _emit_complete(self, exec_request: ExecutionRequest[Any, Any],
-                       result: ExecutionResult[Any]) -> None:
-        if self._hooks.on_complete is not None:
-            self._hooks.on_complete(exec_request, result)
-
-    def _emit_error(self, exec_request: ExecutionRequest[Any, Any],
-                    result: ExecutionResult[Any]) -> None:
-        if self._hooks.on_error is not None:
-            self._hooks.on_error(exec_request, result)
-
     @staticmethod
     def _map_error(error: ExecutionError | None) -> tuple[int, str]:
         if error is None:
             return 500, "unknown error"
 
-        mapping = {
-            "validation": 400,
-            "rejected": 429,
-            "timeout": 504,
-            "runtime": 500,
-            "system": 500,
-        }
-        code = mapping.get(error.kind, 500)
+        code = _ERROR_KIND_STATUS.get(error.kind, 500)
         return code, error.message
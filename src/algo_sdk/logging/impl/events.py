@@ -7,6 +7,9 @@ from ..protocol import ExcInfo, LoggingEventLoggerProtocol
 
 
 class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
+    # Keywords are forwarded as-is: Logger treats exc_info=None and
+    # extra=None exactly like omitted arguments, so no kwargs dict is built
+    # per call.
     def log(
         self,
         level: int,
@@ -18,8 +21,14 @@ class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
         stacklevel: int = 3,
     ) -> None:
         target = logger or logging.getLogger()
-        kwargs = self._build_kwargs(extra, exc_info, stacklevel)
-        target.log(level, message, *args, **kwargs)
+        target.log(
+            level,
+            message,
+            *args,
+            exc_info=exc_info,
+            extra=extra,
+            stacklevel=stacklevel,
+        )
 
     def debug(
         self,
@@ -31,8 +40,13 @@ class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
         stacklevel: int = 3,
     ) -> None:
         target = logger or logging.getLogger()
-        kwargs = self._build_kwargs(extra, exc_info, stacklevel)
-        target.debug(message, *args, **kwargs)
+        target.debug(
+            message,
+            *args,
+            exc_info=exc_info,
+            extra=extra,
+            stacklevel=stacklevel,
+        )
 
     def info(
         self,
@@ -44,8 +58,13 @@ class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
         stacklevel: int = 3,
     ) -> None:
         target = logger or logging.getLogger()
-        kwargs = self._build_kwargs(extra, exc_info, stacklevel)
-        target.info(message, *args, **kwargs)
+        target.info(
+            message,
+            *args,
+            exc_info=exc_info,
+            extra=extra,
+            stacklevel=stacklevel,
+        )
 
     def warning(
         self,
@@ -57,8 +76,13 @@ class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
         stacklevel: int = 3,
     ) -> None:
         target = logger or logging.getLogger()
-        kwargs = self._build_kwargs(extra, exc_info, stacklevel)
-        target.warning(message, *args, **kwargs)
+        target.warning(
+            message,
+            *args,
+            exc_info=exc_info,
+            extra=extra,
+            stacklevel=stacklevel,
+        )
 
     def error(
         self,
@@ -70,8 +94,13 @@ class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
         stacklevel: int = 3,
     ) -> None:
         target = logger or logging.getLogger()
-        kwargs = self._build_kwargs(extra, exc_info, stacklevel)
-        target.error(message, *args, **kwargs)
+        target.error(
+            message,
+            *args,
+            exc_info=exc_info,
+            extra=extra,
+            stacklevel=stacklevel,
+        )
 
     def exception(
         self,
@@ -83,18 +112,10 @@ class StandardLoggingEventLogger(LoggingEventLoggerProtocol):
         stacklevel: int = 3,
     ) -> None:
         target = logger or logging.getLogger()
-        kwargs = self._build_kwargs(extra, exc_info, stacklevel)
-        target.exception(message, *args, **kwargs)
-
-    @staticmethod
-    def _build_kwargs(
-        extra: Mapping[str, object] | None,
-        exc_info: ExcInfo,
-        stacklevel: int,
-    ) -> dict[str, object]:
-        kwargs: dict[str, object] = {"stacklevel": stacklevel}
-        if extra is not None:
-            kwargs["extra"] = extra
-        if exc_info is not None:
-            kwargs["exc_info"] = exc_info
-        return kwargs
+        target.exception(
+            message,
+            *args,
+            exc_info=True if exc_info is None else exc_info,
+            extra=extra,
+            stacklevel=stacklevel,
+        )
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    TimedRotatingFileHandler,
+)
 
 from ..protocol import LoggingConfiguratorProtocol
 from ..settings import LoggingSettings
 
-_BUILTIN_LOG_RECORD_ATTRS = {
+_BUILTIN_LOG_RECORD_ATTRS = frozenset({
     "args",
     "created",
     "exc_info",
@@ -29,9 +36,20 @@ _BUILTIN_LOG_RECORD_ATTRS = {
     "processName",
     "relativeCreated",
     "stack_info",
+    "taskName",
     "thread",
     "threadName",
-}
+})
+
+# Attribute count of a record created without ``extra``; records at or
+# below it carry nothing beyond the builtin attributes.
+_PLAIN_RECORD_SIZE = len(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", None, None).__dict__
+)
+
+# One shared encoder: json.dumps() builds a new JSONEncoder per call
+# whenever a non-default option such as ``default`` is passed.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=True, default=str)
 
 
 class JsonFormatter(logging.Formatter):
@@ -48,27 +66,44 @@ class JsonFormatter(logging.Formatter):
             payload["exc_info"] = self.formatException(record.exc_info)
         if record.stack_info:
             payload["stack_info"] = record.stack_info
-        extras = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key not in _BUILTIN_LOG_RECORD_ATTRS
-        }
-        if extras:
-            payload.update(extras)
-        return json.dumps(payload, ensure_ascii=True, default=str)
+        attrs = record.__dict__
+        if len(attrs) > _PLAIN_RECORD_SIZE:
+            builtin = _BUILTIN_LOG_RECORD_ATTRS  # local: read once per key
+            for key, value in attrs.items():
+                if key not in builtin:
+                    payload[key] = value
+        return _JSON_ENCODER.encode(payload)
 
 
 class PayloadLogFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        return (
-            hasattr(record, "input_preview")
-            or hasattr(record, "output_preview")
-        )
+        # Payload previews arrive via ``extra``; plain records cannot match.
+        attrs = record.__dict__
+        if len(attrs) <= _PLAIN_RECORD_SIZE:
+            return False
+        return "input_preview" in attrs or "output_preview" in attrs
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the handlers behind the queue.
+
+    The stock ``prepare`` renders the record with a plain formatter and
+    drops ``exc_info``, which would change the JSON written to the files.
+    Only the message args are merged here, so the record no longer refers
+    to caller-owned objects once it crosses threads.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class StandardLoggingConfigurator(LoggingConfiguratorProtocol):
     def __init__(self, settings: LoggingSettings) -> None:
         self._settings = settings
+        self._listener: QueueListener | None = None
 
     def configure(self) -> None:
         logger = logging.getLogger()
@@ -77,20 +112,41 @@ class StandardLoggingConfigurator(LoggingConfiguratorProtocol):
             return
         logger.setLevel(self._settings.level)
         formatter = JsonFormatter()
-        for handler in self._build_handlers(formatter):
-            logger.addHandler(handler)
+        if self._settings.console_enabled:
+            logger.addHandler(self._build_console_handler(formatter))
+        file_handlers = self._build_file_handlers(formatter)
+        if file_handlers:
+            # File writes happen on the listener thread; callers only
+            # enqueue the record.
+            log_queue: queue.SimpleQueue[logging.LogRecord] = (
+                queue.SimpleQueue()
+            )
+            self._listener = QueueListener(
+                log_queue, *file_handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.shutdown)
+            logger.addHandler(_RecordQueueHandler(log_queue))
         setattr(logger, marker, True)
 
-    def _build_handlers(
+    def shutdown(self) -> None:
+        """Flush queued records and stop the file writer thread."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
+    def _build_console_handler(
+        self, formatter: logging.Formatter
+    ) -> logging.Handler:
+        console = logging.StreamHandler()
+        console.setLevel(self._settings.level)
+        console.setFormatter(formatter)
+        return console
+
+    def _build_file_handlers(
         self, formatter: logging.Formatter
     ) -> list[logging.Handler]:
         handlers: list[logging.Handler] = []
-        if self._settings.console_enabled:
-            console = logging.StreamHandler()
-            console.setLevel(self._settings.level)
-            console.setFormatter(formatter)
-            handlers.append(console)
-
         if self._settings.error_dir:
             handlers.append(
                 self._build_file_handler(
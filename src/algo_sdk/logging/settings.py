@@ -4,6 +4,8 @@ import logging
 import os
 from dataclasses import dataclass
 
+from ..config.env import get_env_bool_default, get_env_int, get_env_str
+
 
 @dataclass(frozen=True, slots=True)
 class LoggingSettings:
@@ -18,12 +20,14 @@ class LoggingSettings:
 
     @classmethod
     def from_env(cls) -> "LoggingSettings":
-        level_name = _get_env_str("LOG_LEVEL", "INFO").upper()
+        level_name = (get_env_str("LOG_LEVEL") or "INFO").upper()
         level = _parse_level(level_name)
-        rotate_when = _get_env_str("LOG_ROTATE_WHEN", "midnight")
-        backup_count = _get_env_int("LOG_BACKUP_COUNT", 14)
-        general_enabled = _get_env_bool("LOG_GENERAL_ENABLED", False)
-        console_enabled = _get_env_bool("LOG_CONSOLE_ENABLED", True)
+        rotate_when = get_env_str("LOG_ROTATE_WHEN") or "midnight"
+        backup_count = get_env_int("LOG_BACKUP_COUNT")
+        if backup_count is None:
+            backup_count = 14
+        general_enabled = get_env_bool_default("LOG_GENERAL_ENABLED", False)
+        console_enabled = get_env_bool_default("LOG_CONSOLE_ENABLED", True)
         error_dir = _get_env_path("LOG_ERROR_DIR", "logs/error")
         payload_dir = _get_env_path("LOG_PAYLOAD_DIR", "logs/payload")
         general_dir = _get_env_path("LOG_GENERAL_DIR", "logs/general")
@@ -52,32 +56,6 @@ def _parse_level(level_name: str) -> int:
     raise ValueError(f"Invalid LOG_LEVEL: {level_name!r}")
 
 
-def _get_env_str(name: str, default: str) -> str:
-    value = os.getenv(name)
-    if value is None or not value.strip():
-        return default
-    return value.strip()
-
-
-def _get_env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
-    if value is None or not value.strip():
-        return default
-    return int(value)
-
-
-def _get_env_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
-    if value is None or not value.strip():
-        return default
-    value = value.strip().lower()
-    if value in {"1", "true", "yes", "y", "on"}:
-        return True
-    if value in {"0", "false", "no", "n", "off"}:
-        return False
-    raise ValueError(f"Invalid bool env var {name}={value!r}")
-
-
 def _get_env_path(name: str, default: str) -> str | None:
     value = os.getenv(name)
     if value is None:
@@ -19,23 +19,36 @@ def create_observation_hooks(
     *recorders: ObservationRecorder | None,
 ) -> ObservationHooks:
     """Build ObservationHooks that fan out to provided recorders."""
+    active = tuple(recorder for recorder in recorders if recorder is not None)
+    if not active:
+        # Unset hooks fall back to the service's shared no-ops.
+        return ObservationHooks()
+    if len(active) == 1:
+        (recorder,) = active
+        return ObservationHooks(
+            on_start=recorder.on_start,
+            on_complete=recorder.on_complete,
+            on_error=recorder.on_error,
+        )
+
+    # Bind the recorder methods once; the hooks run on every invocation.
+    start_hooks = tuple(recorder.on_start for recorder in active)
+    complete_hooks = tuple(recorder.on_complete for recorder in active)
+    error_hooks = tuple(recorder.on_error for recorder in active)
 
     def _on_start(request: ExecutionRequest[Any, Any]) -> None:
-        for recorder in recorders:
-            if recorder is not None:
-                recorder.on_start(request)
+        for hook in start_hooks:
+            hook(request)
 
     def _on_complete(request: ExecutionRequest[Any, Any],
                      result: ExecutionResult[Any]) -> None:
-        for recorder in recorders:
-            if recorder is not None:
-                recorder.on_complete(request, result)
+        for hook in complete_hooks:
+            hook(request, result)
 
     def _on_error(request: ExecutionRequest[Any, Any],
                   result: ExecutionResult[Any]) -> None:
-        for recorder in recorders:
-            if recorder is not None:
-                recorder.on_error(request, result)
+        for hook in error_hooks:
+            hook(request, result)
 
     return ObservationHooks(
         on_start=_on_start,
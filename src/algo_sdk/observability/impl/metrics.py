@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
 from threading import Lock
-from typing import Any
+from typing import Any, Iterator
 
 from ...core import ExecutionRequest, ExecutionResult
 
@@ -33,13 +36,11 @@ class Histogram:
             self.counts = [0] * (len(self.buckets) + 1)
 
     def observe(self, value: float) -> None:
+        # Buckets are sorted upper bounds; bisect_left finds the first bound
+        # >= value, and len(buckets) is the +Inf slot.
+        self.counts[bisect_left(self.buckets, value)] += 1
         self.total_count += 1
         self.total_sum += value
-        for index, bound in enumerate(self.buckets):
-            if value <= bound:
-                self.counts[index] += 1
-                return
-        self.counts[-1] += 1
 
     def snapshot(self) -> "HistogramSnapshot":
         return HistogramSnapshot(
@@ -85,17 +86,48 @@ class AlgorithmMetricsSnapshot:
     queue_wait_ms: HistogramSnapshot
 
 
+# Lock stripes for InMemoryMetrics; a power of two so a mask picks one.
+_METRIC_SHARDS = 32
+
+_MetricsKey = tuple[str, str]
+_MetricsShard = tuple[Lock, dict[_MetricsKey, AlgorithmMetrics]]
+
+
 class InMemoryMetrics:
-    """In-memory metrics recorder for algorithm executions."""
+    """In-memory metrics recorder for algorithm executions.
+
+    Per-algorithm metrics are spread over lock-striped shards, so
+    executions of different algorithms rarely contend on the same lock.
+    """
 
     def __init__(self) -> None:
-        self._lock = Lock()
-        self._metrics: dict[tuple[str, str], AlgorithmMetrics] = {}
+        self._shards: tuple[_MetricsShard, ...] = tuple(
+            (Lock(), {}) for _ in range(_METRIC_SHARDS)
+        )
+        self._shard_mask = _METRIC_SHARDS - 1
+        # Keys in first-seen order, so snapshots keep insertion order.
+        self._order: dict[_MetricsKey, None] = {}
+        self._order_lock = Lock()
+
+    def _shard(self, key: _MetricsKey) -> _MetricsShard:
+        return self._shards[hash(key) & self._shard_mask]
+
+    def _create(
+        self, key: _MetricsKey, shard: dict[_MetricsKey, AlgorithmMetrics]
+    ) -> AlgorithmMetrics:
+        # Called with the shard's lock held; runs once per algorithm.
+        metrics = shard[key] = AlgorithmMetrics()
+        with self._order_lock:
+            self._order[key] = None
+        return metrics
 
     def on_start(self, request: ExecutionRequest[Any, Any]) -> None:
         key = request.spec.key()
-        with self._lock:
-            metrics = self._metrics.setdefault(key, AlgorithmMetrics())
+        lock, shard = self._shard(key)
+        with lock:
+            metrics = shard.get(key)
+            if metrics is None:
+                metrics = self._create(key, shard)
             metrics.requests_total += 1
             metrics.inflight += 1
 
@@ -108,15 +140,31 @@ class InMemoryMetrics:
         self._record_completion(request, result, failed=True)
 
     def snapshot(self) -> dict[tuple[str, str], AlgorithmMetricsSnapshot]:
-        with self._lock:
-            return {
-                key: metrics.snapshot()
-                for key, metrics in self._metrics.items()
-            }
+        """Snapshot every algorithm, in the order they were first seen.
+
+        Each algorithm is read under its own shard's lock, so the result
+        is consistent per algorithm rather than across all of them.
+        """
+        with self._order_lock:
+            keys = list(self._order)
+        merged: dict[_MetricsKey, AlgorithmMetricsSnapshot] = {}
+        for key in keys:
+            lock, shard = self._shard(key)
+            with lock:
+                merged[key] = shard[key].snapshot()
+        return merged
 
     def render_prometheus_text(self, *, namespace: str = "algo_sdk") -> str:
         return render_prometheus_text(self.snapshot(), namespace=namespace)
 
+    def render_prometheus_bytes(
+        self, *, namespace: str = "algo_sdk"
+    ) -> bytes:
+        """Render the exposition text already encoded as UTF-8."""
+        return self.render_prometheus_text(namespace=namespace).encode(
+            "utf-8"
+        )
+
     def build_otel_metrics(self, *,
                            service_name: str = "algo-sdk") -> dict[str, Any]:
         return build_otel_metrics(self.snapshot(), service_name=service_name)
@@ -125,20 +173,21 @@ class InMemoryMetrics:
                            result: ExecutionResult[Any],
                            *, failed: bool) -> None:
         key = request.spec.key()
-        with self._lock:
-            metrics = self._metrics.setdefault(key, AlgorithmMetrics())
+        # Read the timings before locking; only the updates need the lock.
+        duration_ms = result.duration_ms
+        queue_wait_ms = result.queue_wait_ms
+        lock, shard = self._shard(key)
+        with lock:
+            metrics = shard.get(key)
+            if metrics is None:
+                metrics = self._create(key, shard)
             metrics.inflight = max(0, metrics.inflight - 1)
             if failed:
                 metrics.requests_failed += 1
-            self._observe_timing(metrics, result)
-
-    @staticmethod
-    def _observe_timing(metrics: AlgorithmMetrics,
-                        result: ExecutionResult[Any]) -> None:
-        if result.duration_ms is not None:
-            metrics.latency_ms.observe(result.duration_ms)
-        if result.queue_wait_ms is not None:
-            metrics.queue_wait_ms.observe(result.queue_wait_ms)
+            if duration_ms is not None:
+                metrics.latency_ms.observe(duration_ms)
+            if queue_wait_ms is not None:
+                metrics.queue_wait_ms.observe(queue_wait_ms)
 
 
 def render_prometheus_text(
@@ -146,55 +195,70 @@ def render_prometheus_text(
     *,
     namespace: str = "algo_sdk",
 ) -> str:
-    lines: list[str] = []
+    return "".join(_iter_prometheus_text(snapshot, namespace=namespace))
+
+
+def _iter_prometheus_text(
+    snapshot: dict[tuple[str, str], AlgorithmMetricsSnapshot],
+    *,
+    namespace: str = "algo_sdk",
+) -> Iterator[str]:
+    """Yield the exposition text as a header chunk plus one per algorithm."""
     prefix = namespace.strip("_")
     if prefix:
         prefix = f"{prefix}_"
 
-    lines.extend([
-        f"# HELP {prefix}requests_total Total algorithm requests.",
-        f"# TYPE {prefix}requests_total counter",
-        f"# HELP {prefix}requests_failed_total Total failed algorithm requests.",
-        f"# TYPE {prefix}requests_failed_total counter",
-        f"# HELP {prefix}requests_inflight Current inflight algorithm requests.",
-        f"# TYPE {prefix}requests_inflight gauge",
-        f"# HELP {prefix}request_latency_ms Algorithm execution latency in ms.",
-        f"# TYPE {prefix}request_latency_ms histogram",
-        f"# HELP {prefix}queue_wait_ms Queue wait time in ms.",
-        f"# TYPE {prefix}queue_wait_ms histogram",
-    ])
+    yield _prometheus_header(prefix)
 
     for (algo_name, algo_version), metrics in snapshot.items():
-        labels = {
-            "algo_name": algo_name,
-            "algo_version": algo_version,
-        }
-        lines.append(
-            f"{prefix}requests_total{_format_labels(labels)} "
-            f"{metrics.requests_total}"
-        )
-        lines.append(
-            f"{prefix}requests_failed_total{_format_labels(labels)} "
-            f"{metrics.requests_failed}"
-        )
-        lines.append(
-            f"{prefix}requests_inflight{_format_labels(labels)} "
-            f"{metrics.inflight}"
+        # Every series of an algorithm shares these labels; escape them once.
+        label_body = (
+            f'algo_name="{_escape_label(algo_name)}",'
+            f'algo_version="{_escape_label(algo_version)}"'
         )
-
+        labels = f"{{{label_body}}}"
+        lines: list[str] = [
+            f"{prefix}requests_total{labels} {metrics.requests_total}",
+            f"{prefix}requests_failed_total{labels} "
+            f"{metrics.requests_failed}",
+            f"{prefix}requests_inflight{labels} {metrics.inflight}",
+        ]
         _append_histogram(
             lines,
             f"{prefix}request_latency_ms",
             metrics.latency_ms,
-            labels,
+            label_body,
         )
         _append_histogram(
             lines,
             f"{prefix}queue_wait_ms",
             metrics.queue_wait_ms,
-            labels,
+            label_body,
         )
+        yield _join_lines(lines)
+
+
+@lru_cache(maxsize=32)
+def _prometheus_header(prefix: str) -> str:
+    """HELP/TYPE block for a metric prefix; it only varies by namespace."""
+    return _join_lines([
+        f"# HELP {prefix}requests_total Total algorithm requests.",
+        f"# TYPE {prefix}requests_total counter",
+        f"# HELP {prefix}requests_failed_total "
+        "Total failed algorithm requests.",
+        f"# TYPE {prefix}requests_failed_total counter",
+        f"# HELP {prefix}requests_inflight "
+        "Current inflight algorithm requests.",
+        f"# TYPE {prefix}requests_inflight gauge",
+        f"# HELP {prefix}request_latency_ms "
+        "Algorithm execution latency in ms.",
+        f"# TYPE {prefix}request_latency_ms histogram",
+        f"# HELP {prefix}queue_wait_ms Queue wait time in ms.",
+        f"# TYPE {prefix}queue_wait_ms histogram",
+    ])
+
 
+def _join_lines(lines: list[str]) -> str:
     return "\n".join(lines) + "\n"
 
 
@@ -203,44 +267,61 @@ def build_otel_metrics(
     *,
     service_name: str = "algo-sdk",
 ) -> dict[str, Any]:
-    metrics_payload: list[dict[str, Any]] = []
+    # One metric per name with a data point per algorithm, as OTLP
+    # intends, rather than five whole metric objects per algorithm.
+    requests_total: list[dict[str, Any]] = []
+    requests_failed: list[dict[str, Any]] = []
+    inflight: list[dict[str, Any]] = []
+    latency: list[dict[str, Any]] = []
+    queue_wait: list[dict[str, Any]] = []
     for (algo_name, algo_version), metrics in snapshot.items():
         attributes = [
             {"key": "algo.name", "value": {"stringValue": algo_name}},
             {"key": "algo.version", "value": {"stringValue": algo_version}},
         ]
-        metrics_payload.extend([
+        requests_total.append(
+            {"attributes": attributes, "asInt": metrics.requests_total}
+        )
+        requests_failed.append(
+            {"attributes": attributes, "asInt": metrics.requests_failed}
+        )
+        inflight.append(
+            {"attributes": attributes, "asInt": metrics.inflight}
+        )
+        latency.append(_otel_histogram_point(metrics.latency_ms, attributes))
+        queue_wait.append(
+            _otel_histogram_point(metrics.queue_wait_ms, attributes)
+        )
+
+    metrics_payload: list[dict[str, Any]] = []
+    if snapshot:
+        metrics_payload = [
             _otel_sum_metric(
                 "requests_total",
                 "Total algorithm requests.",
-                metrics.requests_total,
-                attributes,
+                requests_total,
             ),
             _otel_sum_metric(
                 "requests_failed_total",
                 "Total failed algorithm requests.",
-                metrics.requests_failed,
-                attributes,
+                requests_failed,
             ),
             _otel_gauge_metric(
                 "requests_inflight",
                 "Current inflight algorithm requests.",
-                metrics.inflight,
-                attributes,
+                inflight,
             ),
             _otel_histogram_metric(
                 "request_latency_ms",
                 "Algorithm execution latency in ms.",
-                metrics.latency_ms,
-                attributes,
+                latency,
             ),
             _otel_histogram_metric(
                 "queue_wait_ms",
                 "Queue wait time in ms.",
-                metrics.queue_wait_ms,
-                attributes,
+                queue_wait,
             ),
-        ])
+        ]
 
     return {
         "resourceMetrics": [
@@ -268,43 +349,28 @@ def _append_histogram(
     lines: list[str],
     metric_name: str,
     snapshot: HistogramSnapshot,
-    labels: dict[str, str],
+    label_body: str,
 ) -> None:
-    cumulative = 0
-    for bound, count in zip(snapshot.buckets, snapshot.counts[:-1]):
-        cumulative += count
-        bound_labels = dict(labels)
-        bound_labels["le"] = _format_float(bound)
+    """Append one histogram's series; ``label_body`` is pre-escaped."""
+    # Snapshots keep per-bucket counts (OTel wants those); Prometheus
+    # buckets are cumulative, and the last running total is the +Inf one.
+    cumulative = tuple(accumulate(snapshot.counts))
+    for le, count in zip(_bucket_bounds(snapshot.buckets), cumulative):
         lines.append(
-            f"{metric_name}_bucket{_format_labels(bound_labels)} "
-            f"{cumulative}"
+            f'{metric_name}_bucket{{{label_body},le="{le}"}} {count}'
         )
-
-    cumulative += snapshot.counts[-1]
-    inf_labels = dict(labels)
-    inf_labels["le"] = "+Inf"
     lines.append(
-        f"{metric_name}_bucket{_format_labels(inf_labels)} "
-        f"{cumulative}"
+        f'{metric_name}_bucket{{{label_body},le="+Inf"}} {cumulative[-1]}'
     )
     lines.append(
-        f"{metric_name}_sum{_format_labels(labels)} "
+        f"{metric_name}_sum{{{label_body}}} "
         f"{_format_float(snapshot.total_sum)}"
     )
     lines.append(
-        f"{metric_name}_count{_format_labels(labels)} "
-        f"{snapshot.total_count}"
+        f"{metric_name}_count{{{label_body}}} {snapshot.total_count}"
     )
 
 
-def _format_labels(labels: dict[str, str]) -> str:
-    if not labels:
-        return ""
-    parts = [f'{key}="{_escape_label(value)}"'
-             for key, value in labels.items()]
-    return "{" + ",".join(parts) + "}"
-
-
 def _escape_label(value: str) -> str:
     escaped = value.replace("\\", "\\\\")
     escaped = escaped.replace("\n", "\\n")
@@ -315,11 +381,16 @@ def _format_float(value: float) -> str:
     return format(value, "g")
 
 
+@lru_cache(maxsize=32)
+def _bucket_bounds(buckets: tuple[float, ...]) -> tuple[str, ...]:
+    """``le`` label values; bucket tuples are fixed, so format them once."""
+    return tuple(_format_float(bound) for bound in buckets)
+
+
 def _otel_sum_metric(
     name: str,
     description: str,
-    value: int,
-    attributes: list[dict[str, Any]],
+    data_points: list[dict[str, Any]],
 ) -> dict[str, Any]:
     return {
         "name": name,
@@ -328,12 +399,7 @@ def _otel_sum_metric(
         "sum": {
             "aggregationTemporality": "AGGREGATION_TEMPORALITY_CUMULATIVE",
             "isMonotonic": True,
-            "dataPoints": [
-                {
-                    "attributes": attributes,
-                    "asInt": value,
-                }
-            ],
+            "dataPoints": data_points,
         },
     }
 
@@ -341,20 +407,14 @@ def _otel_sum_metric(
 def _otel_gauge_metric(
     name: str,
     description: str,
-    value: int,
-    attributes: list[dict[str, Any]],
+    data_points: list[dict[str, Any]],
 ) -> dict[str, Any]:
     return {
         "name": name,
         "description": description,
         "unit": "1",
         "gauge": {
-            "dataPoints": [
-                {
-                    "attributes": attributes,
-                    "asInt": value,
-                }
-            ],
+            "dataPoints": data_points,
         },
     }
 
@@ -362,8 +422,7 @@ def _otel_gauge_metric(
 def _otel_histogram_metric(
     name: str,
     description: str,
-    snapshot: HistogramSnapshot,
-    attributes: list[dict[str, Any]],
+    data_points: list[dict[str, Any]],
 ) -> dict[str, Any]:
     return {
         "name": name,
@@ -371,14 +430,19 @@ def _otel_histogram_metric(
         "unit": "ms",
         "histogram": {
             "aggregationTemporality": "AGGREGATION_TEMPORALITY_CUMULATIVE",
-            "dataPoints": [
-                {
-                    "attributes": attributes,
-                    "count": snapshot.total_count,
-                    "sum": snapshot.total_sum,
-                    "explicitBounds": list(snapshot.buckets),
-                    "bucketCounts": list(snapshot.counts),
-                }
-            ],
+            "dataPoints": data_points,
         },
     }
+
+
+def _otel_histogram_point(
+    snapshot: HistogramSnapshot,
+    attributes: list[dict[str, Any]],
+) -> dict[str, Any]:
+    return {
+        "attributes": attributes,
+        "count": snapshot.total_count,
+        "sum": snapshot.total_sum,
+        "explicitBounds": list(snapshot.buckets),
+        "bucketCounts": list(snapshot.counts),
+    }
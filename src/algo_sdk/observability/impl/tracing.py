@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import time
+from collections import deque
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from threading import Lock
 from typing import Any
 
 from ...core import ExecutionRequest, ExecutionResult
@@ -26,28 +27,35 @@ class Span:
     error_message: str | None = None
 
 
+# Finished spans kept by default; older ones are dropped first.
+DEFAULT_MAX_FINISHED_SPANS = 10_000
+
+
 class InMemoryTracer:
-    """In-memory tracing recorder for algorithm executions."""
+    """In-memory tracing recorder for algorithm executions.
 
-    def __init__(self) -> None:
-        self._lock = Lock()
-        self._active: dict[str, Span] = {}
-        self._finished: list[Span] = []
+    ``on_start`` only notes the request id and start time in a context
+    variable; the ``Span`` is built once, in ``on_complete``/``on_error``,
+    which run in the same invocation context. A completion reported from
+    another context is stamped as starting when it finished.
 
-    def on_start(self, request: ExecutionRequest[Any, Any]) -> None:
-        span = Span(
-            name="algorithm.execute",
-            trace_id=request.trace_id,
-            request_id=request.request_id,
-            algo_name=request.spec.name,
-            algo_version=request.spec.version,
-            tenant_id=request.context.tenantId
-            if request.context is not None else None,
-            user_id=request.context.userId
-            if request.context is not None else None,
+    Finished spans go to a bounded deque, so a long-running service keeps
+    at most ``max_spans`` of them. ``deque.append`` is atomic, so nothing
+    on the recording path takes a lock.
+    """
+
+    def __init__(
+        self, *, max_spans: int = DEFAULT_MAX_FINISHED_SPANS
+    ) -> None:
+        # (request_id, started_at) of the open span. Per instance, so
+        # several tracers never see each other's spans.
+        self._current: ContextVar[tuple[str, float] | None] = ContextVar(
+            f"algo_tracer_span_{id(self):x}", default=None
         )
-        with self._lock:
-            self._active[request.request_id] = span
+        self._finished: deque[Span] = deque(maxlen=max_spans)
+
+    def on_start(self, request: ExecutionRequest[Any, Any]) -> None:
+        self._current.set((request.request_id, time.monotonic()))
 
     def on_complete(self, request: ExecutionRequest[Any, Any],
                     result: ExecutionResult[Any]) -> None:
@@ -58,31 +66,45 @@ class InMemoryTracer:
         self._finish(request, result, status="error")
 
     def spans(self, *, clear: bool = False) -> tuple[Span, ...]:
-        with self._lock:
-            finished = tuple(self._finished)
-            if clear:
-                self._finished.clear()
-            return finished
+        finished = self._finished
+        if not clear:
+            # copy() runs in C without yielding, unlike iterating the deque
+            # while other threads append to it.
+            return tuple(finished.copy())
+        # Drain one span at a time so concurrent appends are never lost.
+        drained: list[Span] = []
+        popleft = finished.popleft
+        while True:
+            try:
+                drained.append(popleft())
+            except IndexError:
+                return tuple(drained)
 
     def _finish(self, request: ExecutionRequest[Any, Any],
                 result: ExecutionResult[Any], *, status: str) -> None:
-        with self._lock:
-            span = self._active.pop(request.request_id, None)
-        if span is None:
-            span = Span(
+        pending = self._current.get()
+        if pending is not None and pending[0] == request.request_id:
+            started_at = pending[1]
+            self._current.set(None)
+        else:
+            started_at = time.monotonic()
+        context = request.context
+        error = result.error
+        self._finished.append(
+            Span(
                 name="algorithm.execute",
                 trace_id=request.trace_id,
                 request_id=request.request_id,
                 algo_name=request.spec.name,
                 algo_version=request.spec.version,
+                tenant_id=context.tenantId if context is not None else None,
+                user_id=context.userId if context is not None else None,
+                status=status,
+                started_at=started_at,
+                ended_at=result.ended_at or time.monotonic(),
+                duration_ms=result.duration_ms,
+                queue_wait_ms=result.queue_wait_ms,
+                error_kind=error.kind if error is not None else None,
+                error_message=error.message if error is not None else None,
             )
-
-        span.status = status
-        span.queue_wait_ms = result.queue_wait_ms
-        span.duration_ms = result.duration_ms
-        span.ended_at = result.ended_at or time.monotonic()
-        if result.error is not None:
-            span.error_kind = result.error.kind
-            span.error_message = result.error.message
-        with self._lock:
-            self._finished.append(span)
+        )
@@ -33,11 +33,15 @@ class AlgorithmRequest(_PydanticBaseModel, Generic[T]):
     data: T
     hyperParams: Dict[str, Any] | None = None
 
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    # Validated once at the HTTP boundary and only read afterwards.
+    model_config = ConfigDict(
+        extra="forbid", populate_by_name=True, frozen=True
+    )
 
     @model_validator(mode="after")
     def _ensure_request_id(self) -> "AlgorithmRequest[T]":
-        if not self.requestId or not self.requestId.strip():
+        # min_length=1 already rejects "", only whitespace is left to check.
+        if not self.requestId.strip():
             raise ValueError("requestId must be non-empty")
         return self
 
@@ -59,7 +63,9 @@ class AlgorithmResponse(_PydanticBaseModel, Generic[T]):
     context: Optional[AlgorithmContext] = None
     data: Optional[T] = None
 
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(
+        extra="forbid", populate_by_name=True, frozen=True
+    )
 
     @model_validator(mode="after")
     def _ensure_message(self) -> "AlgorithmResponse[T]":
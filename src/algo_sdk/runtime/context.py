@@ -2,33 +2,12 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any, Mapping
 
 from ..protocol.models import AlgorithmContext
 
-_CURRENT_CONTEXT: ContextVar[AlgorithmContext | None] = ContextVar(
-    "algo_context",
-    default=None,
-)
-_CURRENT_REQUEST_ID: ContextVar[str | None] = ContextVar(
-    "algo_request_id",
-    default=None,
-)
-_CURRENT_TRACE_ID: ContextVar[str | None] = ContextVar(
-    "algo_trace_id",
-    default=None,
-)
-_CURRENT_REQUEST_DATETIME: ContextVar[datetime | None] = ContextVar(
-    "algo_request_datetime",
-    default=None,
-)
-_CURRENT_RESPONSE_META: ContextVar["ResponseMeta | None"] = ContextVar(
-    "algo_response_meta",
-    default=None,
-)
-
 
 @dataclass(slots=True)
 class ResponseMeta:
@@ -38,12 +17,22 @@ class ResponseMeta:
 
 
 @dataclass(slots=True)
-class ContextTokens:
-    context: Token[AlgorithmContext | None]
-    request_id: Token[str | None]
-    trace_id: Token[str | None]
-    request_datetime: Token[datetime | None]
-    response_meta: Token[ResponseMeta | None]
+class _ExecutionState:
+    context: AlgorithmContext | None
+    request_id: str | None
+    trace_id: str | None
+    request_datetime: datetime | None
+    response_meta: ResponseMeta | None = None
+
+
+# One variable for the whole execution state: entering and leaving an
+# execution is a single set/reset instead of one per field.
+_CURRENT_STATE: ContextVar[_ExecutionState | None] = ContextVar(
+    "algo_execution_state",
+    default=None,
+)
+
+ContextTokens = Token[_ExecutionState | None]
 
 
 def set_execution_context(
@@ -52,44 +41,47 @@ def set_execution_context(
     request_datetime: datetime | None,
     context: AlgorithmContext | None,
 ) -> ContextTokens:
-    return ContextTokens(
-        context=_CURRENT_CONTEXT.set(context),
-        request_id=_CURRENT_REQUEST_ID.set(request_id),
-        trace_id=_CURRENT_TRACE_ID.set(trace_id),
-        request_datetime=_CURRENT_REQUEST_DATETIME.set(request_datetime),
-        response_meta=_CURRENT_RESPONSE_META.set(None),
+    return _CURRENT_STATE.set(
+        _ExecutionState(context, request_id, trace_id, request_datetime)
     )
 
 
 def reset_execution_context(tokens: ContextTokens) -> None:
-    _CURRENT_CONTEXT.reset(tokens.context)
-    _CURRENT_REQUEST_ID.reset(tokens.request_id)
-    _CURRENT_TRACE_ID.reset(tokens.trace_id)
-    _CURRENT_REQUEST_DATETIME.reset(tokens.request_datetime)
-    _CURRENT_RESPONSE_META.reset(tokens.response_meta)
+    _CURRENT_STATE.reset(tokens)
 
 
 def get_current_context() -> AlgorithmContext | None:
-    return _CURRENT_CONTEXT.get()
+    state = _CURRENT_STATE.get()
+    return state.context if state is not None else None
 
 
 def get_current_request_id() -> str | None:
-    return _CURRENT_REQUEST_ID.get()
+    state = _CURRENT_STATE.get()
+    return state.request_id if state is not None else None
 
 
 def get_current_trace_id() -> str | None:
-    return _CURRENT_TRACE_ID.get()
+    state = _CURRENT_STATE.get()
+    return state.trace_id if state is not None else None
 
 
 def get_current_request_datetime() -> datetime | None:
-    return _CURRENT_REQUEST_DATETIME.get()
+    state = _CURRENT_STATE.get()
+    return state.request_datetime if state is not None else None
 
 
 def _ensure_response_meta() -> ResponseMeta:
-    meta = _CURRENT_RESPONSE_META.get()
-    if meta is None:
-        meta = ResponseMeta()
-        _CURRENT_RESPONSE_META.set(meta)
+    state = _CURRENT_STATE.get()
+    if state is not None and state.response_meta is not None:
+        return state.response_meta
+    meta = ResponseMeta()
+    # Copy on write: the state object may be shared with the parent or
+    # sibling contexts, so the new meta goes into a fresh state set here.
+    if state is None:
+        # Outside an execution; keep the meta in the ambient context.
+        _CURRENT_STATE.set(_ExecutionState(None, None, None, None, meta))
+    else:
+        _CURRENT_STATE.set(replace(state, response_meta=meta))
     return meta
 
 
@@ -117,7 +109,8 @@ def set_response_context(
 
 
 def get_response_meta() -> ResponseMeta | None:
-    return _CURRENT_RESPONSE_META.get()
+    state = _CURRENT_STATE.get()
+    return state.response_meta if state is not None else None
 
 
 @contextmanager
@@ -6,8 +6,12 @@ from typing import Iterable
 from algo_sdk.core.executor import ExecutorProtocol
 from algo_sdk.core.registry import AlgorithmRegistry
 from algo_sdk.http.impl.lifecycle_hooks import AlgorithmHttpServiceHook
-from algo_sdk.http.impl.service import AlgorithmHttpService, ObservationHooks
-from algo_sdk.observability import InMemoryMetrics, InMemoryTracer
+from algo_sdk.http.impl.service import AlgorithmHttpService
+from algo_sdk.observability import (
+    InMemoryMetrics,
+    InMemoryTracer,
+    create_observation_hooks,
+)
 from algo_sdk.service_registry.config import ServiceRegistryConfig, load_config
 from algo_sdk.service_registry.impl.lifecycle_hooks import ServiceRegistryHook
 from algo_sdk.service_registry.protocol import ServiceRegistryProtocol
@@ -37,17 +41,7 @@ def build_service_runtime(
     metrics = InMemoryMetrics()
     tracer = InMemoryTracer()
 
-    observation = ObservationHooks(
-        on_start=lambda req: (metrics.on_start(req), tracer.on_start(req)),
-        on_complete=lambda req, res: (
-            metrics.on_complete(req, res),
-            tracer.on_complete(req, res),
-        ),
-        on_error=lambda req, res: (
-            metrics.on_error(req, res),
-            tracer.on_error(req, res),
-        ),
-    )
+    observation = create_observation_hooks(metrics, tracer)
 
     service = AlgorithmHttpService(
         registry=registry, executor=executor, observation=observation
@@ -50,10 +50,12 @@ class ServiceRuntime(ServiceLifecycleProtocol):
         self._lock = asyncio.Lock()
         self._state = ServiceState.CREATED
         self._hooks = list(hooks) if hooks is not None else []
+        self._sorted_hooks = self._sort_hooks(self._hooks)
         self._logger = logger or _LOGGER
 
     def add_hook(self, hook: ServiceLifecycleHookProtocol) -> None:
         self._hooks.append(hook)
+        self._sorted_hooks = self._sort_hooks(self._hooks)
 
     @property
     def state(self) -> ServiceState:
@@ -118,21 +120,19 @@ class ServiceRuntime(ServiceLifecycleProtocol):
             reason=reason,
         )
 
+    @staticmethod
+    def _sort_hooks(
+        hooks: list[ServiceLifecycleHookProtocol],
+    ) -> list[ServiceLifecycleHookProtocol]:
+        # Stable sort: equal priorities keep their registration order.
+        return sorted(
+            hooks, key=lambda hook: -int(getattr(hook, "priority", 0))
+        )
+
     def _eligible_hooks(
         self, phase: ServiceLifecyclePhase
     ) -> list[ServiceLifecycleHookProtocol]:
-        eligible: list[tuple[int, ServiceLifecycleHookProtocol]] = []
-        for index, hook in enumerate(self._hooks):
-            if hook.can_handle(phase):
-                eligible.append((index, hook))
-
-        eligible.sort(
-            key=lambda item: (
-                -int(getattr(item[1], "priority", 0)),
-                item[0],
-            )
-        )
-        return [hook for _, hook in eligible]
+        return [hook for hook in self._sorted_hooks if hook.can_handle(phase)]
 
     async def _transition(
         self,
@@ -0,0 +1,31 @@
+import pytest
+
+from algo_sdk.config.env import (
+    get_env_bool,
+    get_env_bool_default,
+    get_env_int,
+    get_env_list,
+    get_env_str,
+)
+
+
+def test_blank_values_read_as_unset() -> None:
+    env = {"A": "  ", "B": ""}
+    assert get_env_str("A", env) is None
+    assert get_env_int("B", env) is None
+    assert get_env_bool("A", env) is None
+    assert get_env_bool_default("missing", True, env) is True
+    assert get_env_list("B", env) == []
+
+
+def test_values_are_parsed() -> None:
+    env = {"S": " x ", "I": "3", "F": "Off", "L": "a, ,b"}
+    assert get_env_str("S", env) == "x"
+    assert get_env_int("I", env) == 3
+    assert get_env_bool_default("F", True, env) is False
+    assert get_env_list("L", env) == ["a", "b"]
+
+
+def test_invalid_bool_raises() -> None:
+    with pytest.raises(ValueError):
+        get_env_bool("X", {"X": "maybe"})
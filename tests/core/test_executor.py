@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timezone
 
@@ -305,6 +306,66 @@ def test_dispatching_executor_routes_in_process() -> None:
         executor.shutdown()
 
 
+def test_process_pool_reports_saturation_while_slots_are_taken() -> None:
+    spec = _build_sleep_spec()
+    executor = ProcessPoolExecutor(max_workers=1, queue_size=1)
+    try:
+        assert executor.saturated(spec) is False
+        slow = threading.Thread(
+            target=executor.submit,
+            args=(
+                ExecutionRequest(
+                    spec=spec,
+                    payload=_SleepReq(delay=0.5),
+                    request_id="req-slow",
+                ),
+            ),
+        )
+        slow.start()
+        deadline = time.monotonic() + 5
+        while not executor.saturated(spec) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert executor.saturated(spec) is True
+        rejected = executor.submit(
+            ExecutionRequest(
+                spec=spec, payload=_SleepReq(delay=0), request_id="req-full"
+            )
+        )
+        assert rejected.error is not None
+        assert rejected.error.kind == "rejected"
+        slow.join()
+        assert executor.saturated(spec) is False
+    finally:
+        executor.shutdown()
+
+
+def test_dispatching_executor_never_saturates_in_process() -> None:
+    spec = _build_double_spec(
+        execution=ExecutionConfig(execution_mode=ExecutionMode.IN_PROCESS)
+    )
+    executor = DispatchingExecutor(global_max_workers=1, global_queue_size=1)
+    assert executor.saturated(spec) is False
+    assert executor.admission_limit(spec) is None
+
+
+def test_dispatching_executor_admission_limit_follows_routing() -> None:
+    shared = _build_double_spec()
+    isolated = _build_double_spec(
+        execution=ExecutionConfig(isolated_pool=True, max_workers=3)
+    )
+    executor = DispatchingExecutor(
+        global_max_workers=1, global_queue_size=4, isolated_queue_size=None
+    )
+
+    shared_pool, shared_capacity = executor.admission_limit(shared)
+    isolated_pool, isolated_capacity = executor.admission_limit(isolated)
+
+    assert shared_capacity == 4
+    assert isolated_capacity == 6
+    assert shared_pool != isolated_pool
+    assert executor.admission_limit(shared)[0] == shared_pool
+
+
 def test_in_process_propagates_context() -> None:
     spec = _build_ctx_spec()
     executor = InProcessExecutor()
@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError, replace
+
 import pytest
 
 from algo_sdk import (
@@ -69,3 +71,69 @@ def test_register_duplicate_raises() -> None:
     reg.register(spec)
     with pytest.raises(Exception):
         reg.register(spec)
+
+
+def test_register_bumps_version() -> None:
+    reg = AlgorithmRegistry()
+    assert reg.version == 0
+    spec = AlgorithmSpec(
+        name="versioned",
+        version="v1",
+        description=None,
+        created_time="2026-01-06",
+        author="qa",
+        category="unit",
+        input_model=_Req,
+        output_model=_Resp,
+        algorithm_type=AlgorithmType.PREDICTION,
+        execution=ExecutionConfig(),
+        entrypoint=_DoubleAlgo,
+        is_class=True,
+    )
+    reg.register(spec)
+    assert reg.version == 1
+    with pytest.raises(Exception):
+        reg.register(spec)
+    assert reg.version == 1
+
+
+def test_spec_key_follows_dataclass_replace() -> None:
+    spec = AlgorithmSpec(
+        name="demo",
+        version="v1",
+        description=None,
+        created_time="2026-01-06",
+        author="qa",
+        category="unit",
+        input_model=_Req,
+        output_model=_Resp,
+        algorithm_type=AlgorithmType.PREDICTION,
+        entrypoint=_DoubleAlgo,
+        is_class=True,
+    )
+    assert spec.key() == ("demo", "v1")
+    assert spec.key() is spec.key()
+    assert replace(spec, version="v2").key() == ("demo", "v2")
+
+    rebuilt = replace(spec, name="".join(["de", "mo"]))
+    assert rebuilt.key()[0] is spec.key()[0]
+
+
+def test_spec_identity_fields_are_read_only() -> None:
+    spec = AlgorithmSpec(
+        name="demo",
+        version="v1",
+        description=None,
+        created_time="2026-01-06",
+        author="qa",
+        category="unit",
+        input_model=_Req,
+        output_model=_Resp,
+        algorithm_type=AlgorithmType.PREDICTION,
+        entrypoint=_DoubleAlgo,
+        is_class=True,
+    )
+    with pytest.raises(FrozenInstanceError):
+        spec.version = "v2"
+    spec.description = "still mutable"
+    assert spec.key() == ("demo", "v1")
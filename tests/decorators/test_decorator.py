@@ -1,3 +1,5 @@
+from abc import abstractmethod
+
 import pytest
 
 from algo_sdk import (
@@ -117,6 +119,55 @@ def test_local_class_is_marked() -> None:
     assert isinstance(meta, AlgorithmMarker)
 
 
+def test_string_annotations_are_resolved() -> None:
+    deco = DefaultAlgorithmDecorator()
+
+    class _QuotedAlgo(BaseAlgorithm[_Req, _Resp]):
+
+        def run(self, req: "_Req", params: "_ParamsValid") -> "_Resp":  # type: ignore[override]
+            return _Resp(doubled=req.value * 2)
+
+    deco(
+        name="quoted",
+        version="v1",
+        algorithm_type=AlgorithmType.PREDICTION,
+        **_DEFAULT_METADATA,
+    )(_QuotedAlgo)
+
+    meta = getattr(_QuotedAlgo, "__algo_meta__")
+    assert meta.hyperparams_model is _ParamsValid
+
+
+def test_abstract_subclass_of_validated_class_is_rejected() -> None:
+    deco = DefaultAlgorithmDecorator()
+
+    class _Concrete(BaseAlgorithm[_Req, _Resp]):
+
+        def run(self, req: _Req) -> _Resp:  # type: ignore[override]
+            return _Resp(doubled=req.value * 2)
+
+    class _Reabstracted(_Concrete):
+
+        @abstractmethod
+        def run(self, req: _Req) -> _Resp:  # type: ignore[override]
+            raise NotImplementedError
+
+    deco(
+        name="concrete",
+        version="v1",
+        algorithm_type=AlgorithmType.PREDICTION,
+        **_DEFAULT_METADATA,
+    )(_Concrete)
+
+    with pytest.raises(AlgorithmValidationError):
+        deco(
+            name="reabstracted",
+            version="v1",
+            algorithm_type=AlgorithmType.PREDICTION,
+            **_DEFAULT_METADATA,
+        )(_Reabstracted)
+
+
 def test_execution_mode_rejects_string() -> None:
     deco = DefaultAlgorithmDecorator()
 
@@ -155,6 +206,40 @@ def test_logging_config_is_recorded() -> None:
     assert meta.logging["redact_fields"] == ("secret",)
 
 
+class _FieldName(str):
+    pass
+
+
+def test_logging_redact_fields_rejects_str_subclass() -> None:
+    deco = DefaultAlgorithmDecorator()
+
+    with pytest.raises(AlgorithmValidationError, match="redact_fields"):
+        deco(
+            name="log-str-subclass",
+            version="v1",
+            algorithm_type=AlgorithmType.PREDICTION,
+            **_DEFAULT_METADATA,
+            logging={"redact_fields": _FieldName("secret")},
+        )(_AlgoForRegistration)
+
+
+def test_default_configs_are_shared_read_only() -> None:
+    deco = DefaultAlgorithmDecorator()
+
+    deco(
+        name="default-cfg",
+        version="v1",
+        algorithm_type=AlgorithmType.PREDICTION,
+        **_DEFAULT_METADATA,
+    )(_AlgoForRegistration)
+
+    meta = getattr(_AlgoForRegistration, "__algo_meta__")
+    assert meta.execution["execution_mode"] is ExecutionMode.PROCESS_POOL
+    assert meta.logging["enabled"] is False
+    with pytest.raises(TypeError):
+        meta.execution["stateful"] = True  # type: ignore[index]
+
+
 def test_hyperparams_requires_hyperparams_base() -> None:
     deco = DefaultAlgorithmDecorator()
 
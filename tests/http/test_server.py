@@ -1,6 +1,12 @@
+import asyncio
+import json
+import logging
+import os
+import threading
 from datetime import datetime, timezone
 
 import pytest
+import uvicorn
 from fastapi.testclient import TestClient
 
 from algo_sdk import (
@@ -12,6 +18,7 @@ from algo_sdk import (
     create_app,
     http_server,
 )
+from algo_sdk.runtime import ServiceState
 
 
 class Req(BaseModel):
@@ -51,6 +58,27 @@ def client():
         yield c
 
 
+@pytest.fixture
+def isolated_logging(monkeypatch, tmp_path):
+    """Send run()'s log files to tmp_path and undo its root logger setup."""
+    for kind in ("error", "payload", "general"):
+        monkeypatch.setenv(
+            f"LOG_{kind.upper()}_DIR", str(tmp_path / "logs" / kind)
+        )
+    root = logging.getLogger()
+    marker = "_algo_sdk_logging_configured"
+    saved_handlers, saved_level = root.handlers[:], root.level
+    saved_marker = getattr(root, marker, False)
+    setattr(root, marker, False)
+    yield
+    for handler in root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+    setattr(root, marker, saved_marker)
+
+
 def test_healthz(client):
     response = client.get("/healthz")
     assert response.status_code == 200
@@ -82,6 +110,36 @@ def test_list_algorithms(client):
     assert algo["extra"] == {"owner": "unit"}
 
 
+def _make_spec(name: str) -> AlgorithmSpec:
+    return AlgorithmSpec(
+        name=name,
+        version="v1",
+        algorithm_type=AlgorithmType.PROGRAMME,
+        description="test",
+        created_time="2026-01-06",
+        author="qa",
+        category="unit",
+        input_model=Req,
+        output_model=Resp,
+        execution=ExecutionConfig(),
+        entrypoint=mock_algo,
+        is_class=False,
+    )
+
+
+def test_list_algorithms_reflects_later_registration():
+    registry = AlgorithmRegistry()
+    registry.register(_make_spec("first"))
+    app = create_app(registry)
+    with TestClient(app) as client:
+        first = client.get("/algorithms").json()["data"]
+        assert [a["name"] for a in first] == ["first"]
+
+        registry.register(_make_spec("second"))
+        names = {a["name"] for a in client.get("/algorithms").json()["data"]}
+        assert names == {"first", "second"}
+
+
 def test_invoke_algorithm(client):
     req_body = {
         "requestId": "test-1",
@@ -97,6 +155,86 @@ def test_invoke_algorithm(client):
     assert data["data"]["doubled"] == 10
 
 
+class _FloatReq(BaseModel):
+    value: float
+
+
+class _FloatResp(BaseModel):
+    doubled: float
+
+
+def _double_float(req: _FloatReq) -> _FloatResp:
+    return _FloatResp(doubled=req.value * 2)
+
+
+def test_invoke_algorithm_rejects_non_finite_output():
+    registry = AlgorithmRegistry()
+    registry.register(
+        AlgorithmSpec(
+            name="float_algo",
+            version="v1",
+            algorithm_type=AlgorithmType.PROGRAMME,
+            description=None,
+            created_time="2026-01-06",
+            author="qa",
+            category="unit",
+            input_model=_FloatReq,
+            output_model=_FloatResp,
+            execution=ExecutionConfig(),
+            entrypoint=_double_float,
+            is_class=False,
+        )
+    )
+    body = {
+        "requestId": "overflow",
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "data": {"value": 1e308},
+    }
+    with TestClient(create_app(registry)) as client:
+        response = client.post("/algorithms/float_algo/v1", json=body)
+
+    data = response.json()
+    assert data["code"] == 500
+    assert "Out of range float values" in data["message"]
+
+
+def test_invoke_algorithm_batch_keeps_input_order(client):
+    now = datetime.now(timezone.utc).isoformat()
+    body = [
+        {"requestId": f"batch-{i}", "datetime": now, "data": {"value": i}}
+        for i in range(5)
+    ]
+    response = client.post("/algorithms/test_algo/v1/batch", json=body)
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["code"] == 0
+    assert [item["requestId"] for item in payload["data"]] == [
+        f"batch-{i}" for i in range(5)
+    ]
+    assert [item["data"]["doubled"] for item in payload["data"]] == [
+        0, 2, 4, 6, 8
+    ]
+    assert {item["algorithmName"] for item in payload["data"]} == {
+        "test_algo"
+    }
+
+
+def test_invoke_algorithm_batch_rejects_oversized_batch(monkeypatch):
+    monkeypatch.setenv("SERVICE_BATCH_MAX_SIZE", "2")
+    registry = AlgorithmRegistry()
+    registry.register(_make_spec("batch_algo"))
+    now = datetime.now(timezone.utc).isoformat()
+    body = [
+        {"requestId": f"b-{i}", "datetime": now, "data": {"value": i}}
+        for i in range(3)
+    ]
+    with TestClient(create_app(registry)) as client:
+        response = client.post("/algorithms/batch_algo/v1/batch", json=body)
+        unknown = client.post("/algorithms/missing/v1/batch", json=body[:1])
+    assert response.json()["code"] == 413
+    assert unknown.json()["code"] == 500
+
+
 def test_schema_includes_metadata(client):
     response = client.get("/algorithms/test_algo/v1/schema")
     assert response.status_code == 200
@@ -107,6 +245,8 @@ def test_schema_includes_metadata(client):
     assert data["category"] == "unit"
     assert data["applicationScenarios"] == "demo"
     assert data["extra"] == {"owner": "unit"}
+    assert data["execution"]["executionMode"] == "process_pool"
+    assert data["execution"]["isolatedPool"] is False
 
 
 def test_metrics(client):
@@ -114,9 +254,32 @@ def test_metrics(client):
     test_invoke_algorithm(client)
     response = client.get("/metrics")
     assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
     assert "requests_total" in response.text
 
 
+@pytest.mark.parametrize(
+    ("cache_s", "refreshed"), [("60", False), ("0", True)]
+)
+def test_metrics_reuses_render_within_cache_window(cache_s, refreshed):
+    registry = AlgorithmRegistry()
+    registry.register(_make_spec("metrics_algo"))
+    settings = http_server._EnvSnapshot.from_env(
+        {"SERVICE_METRICS_CACHE_S": cache_s}
+    )
+    body = {
+        "requestId": "metrics-1",
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "data": {"value": 1},
+    }
+    with TestClient(create_app(registry, settings=settings)) as client:
+        first = client.get("/metrics").text
+        client.post("/algorithms/metrics_algo/v1", json=body)
+        second = client.get("/metrics").text
+    assert "metrics_algo" not in first
+    assert ("metrics_algo" in second) is refreshed
+
+
 def test_service_info(monkeypatch):
     monkeypatch.setenv("SERVICE_NAME", "algo-core-service")
     monkeypatch.setenv("SERVICE_VERSION", "1.2.3")
@@ -242,7 +405,20 @@ def test_swagger_docs_disabled(monkeypatch):
         assert client.get("/docs").status_code == 404
 
 
-def test_module_dir_loading(monkeypatch, tmp_path):
+def test_offline_swagger_docs(monkeypatch, tmp_path):
+    monkeypatch.setenv("SERVICE_SWAGGER_ENABLED", "true")
+    monkeypatch.setenv("SERVICE_SWAGGER_OFFLINE", "true")
+    monkeypatch.setenv("SERVICE_SWAGGER_STATIC_DIR", str(tmp_path))
+    app = create_app(AlgorithmRegistry())
+    with TestClient(app) as client:
+        response = client.get("/docs")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "Algorithm Service - Swagger UI" in response.text
+        assert 'url: "/openapi.json"' in response.text
+
+
+def test_module_dir_loading(monkeypatch, tmp_path, isolated_logging):
     package_dir = tmp_path / "demo_pkg"
     package_dir.mkdir()
     (package_dir / "__init__.py").write_text(
@@ -283,9 +459,395 @@ __all__ = ["DemoAlgo"]
 
     registry = AlgorithmRegistry()
     monkeypatch.setattr(http_server, "get_registry", lambda: registry)
-    monkeypatch.setattr(http_server.uvicorn, "run", lambda *args, **kwargs: None)
+    monkeypatch.setattr(uvicorn, "run", lambda *args, **kwargs: None)
 
     http_server.run(env_path=env_path)
 
     spec = registry.get("demo", "v1")
     assert spec.algorithm_type is AlgorithmType.PREDICTION
+
+
+def test_load_env_file_restores_removed_variables(monkeypatch, tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("ALGO_TEST_ENV_FLAG=on\n", encoding="utf-8")
+    monkeypatch.delenv("ALGO_TEST_ENV_FLAG", raising=False)
+
+    http_server._load_env_file(env_path)
+    monkeypatch.delenv("ALGO_TEST_ENV_FLAG")
+    http_server._load_env_file(env_path)
+
+    assert os.environ["ALGO_TEST_ENV_FLAG"] == "on"
+    monkeypatch.delenv("ALGO_TEST_ENV_FLAG")
+
+
+def test_env_snapshot_reads_given_mapping():
+    settings = http_server._EnvSnapshot.from_env(
+        {
+            "SERVICE_SWAGGER_PATH": " api-docs ",
+            "CORS_ENABLED": "yes",
+            "CORS_ALLOW_ORIGINS": "http://a, http://b",
+            "EXECUTOR_GLOBAL_MAX_WORKERS": "4",
+            "SERVICE_PORT": "9001",
+            "ALGO_MODULES": "pkg.a, ,pkg.b",
+        }
+    )
+    assert settings.bind_host == "127.0.0.1"
+    assert settings.port == 9001
+    assert settings.workers == 1
+    assert settings.algo_modules == ["pkg.a", "pkg.b"]
+    assert settings.algo_module_dir is None
+    assert settings.swagger_enabled is True
+    assert settings.swagger_path == "/api-docs"
+    assert settings.cors_enabled is True
+    assert settings.cors_allow_origins == ["http://a", "http://b"]
+    assert settings.cors_allow_methods == ["*"]
+    assert settings.admin_enabled is False
+    assert settings.executor_global_max_workers == 4
+    assert settings.executor_kill_tree is None
+
+
+def test_load_algorithm_modules_reexecutes_path_modules(tmp_path):
+    module_file = tmp_path / "plain_mod.py"
+    module_file.write_text("VALUE = 1\n", encoding="utf-8")
+
+    first = http_server.load_algorithm_modules([str(module_file)])
+    second = http_server.load_algorithm_modules([str(module_file)])
+
+    assert len(first) == 1
+    assert first[0] is not second[0]
+    assert second[0].VALUE == 1
+
+
+@pytest.mark.parametrize(
+    ("module_spec", "expected"),
+    [
+        ("pkg.mod", ("pkg.mod", None)),
+        ("pkg.mod:attr", ("pkg.mod", "attr")),
+        ("x:attr", ("x", "attr")),
+        ("C:\\algos\\demo.py", ("C:\\algos\\demo.py", None)),
+        ("C:/algos/demo.py:attr", ("C:/algos/demo.py", "attr")),
+    ],
+)
+def test_split_module_spec(module_spec, expected):
+    assert http_server._split_module_spec(module_spec) == expected
+
+
+def test_access_log_filter_drops_excluded_paths():
+    log_filter = http_server._AccessLogExcludePathsFilter(
+        {"/healthz", "/readyz"}
+    )
+
+    def _record(method: str, path: str) -> logging.LogRecord:
+        return logging.LogRecord(
+            "uvicorn.access",
+            logging.INFO,
+            __file__,
+            0,
+            '%s - "%s %s HTTP/%s" %d',
+            ("127.0.0.1:5000", method, path, "1.1", 200),
+            None,
+        )
+
+    assert log_filter.filter(_record("GET", "/healthz")) is False
+    assert log_filter.filter(_record("HEAD", "/readyz")) is False
+    assert log_filter.filter(_record("GET", "/healthz/extra")) is True
+    assert log_filter.filter(_record("POST", "/algorithms/a/v1")) is True
+
+
+def test_invoke_rejected_while_draining(monkeypatch):
+    monkeypatch.setenv("SERVICE_ADMIN_ENABLED", "true")
+    registry = AlgorithmRegistry()
+    registry.register(_make_spec("drain_algo"))
+    app = create_app(registry)
+    with TestClient(app) as client:
+        drained = client.post("/admin/lifecycle/draining")
+        assert drained.json() == {"state": "Draining"}
+
+        response = client.post(
+            "/algorithms/drain_algo/v1",
+            json={
+                "requestId": "drain-1",
+                "datetime": datetime.now(timezone.utc).isoformat(),
+                "data": {"value": 1},
+            },
+        )
+        assert response.status_code == 429
+        payload = response.json()
+        assert payload["code"] == 429
+        assert payload["message"] == (
+            "service not accepting requests: Draining"
+        )
+        assert payload["requestId"] == "drain-1"
+        assert payload["datetime"].endswith("Z")
+
+        batch = client.post("/algorithms/drain_algo/v1/batch", json=[])
+        assert batch.status_code == 429
+        assert batch.json()["requestId"] is None
+
+
+def test_load_algorithm_modules_from_package_dir(tmp_path):
+    package_dir = tmp_path / "dir_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("NAME = 'pkg'\n", encoding="utf-8")
+
+    loaded = http_server.load_algorithm_modules(
+        [str(package_dir), str(tmp_path / "missing.py")]
+    )
+
+    assert [module.NAME for module in loaded] == ["pkg"]
+
+
+@pytest.mark.parametrize("sequential", ["false", "true"])
+def test_load_algorithm_modules_keeps_input_order(
+    monkeypatch, tmp_path, sequential
+):
+    monkeypatch.setenv("ALGO_MODULES_SEQUENTIAL", sequential)
+    names = [f"order_{sequential}_{index}" for index in range(5)]
+    for name in names:
+        (tmp_path / f"{name}.py").write_text(
+            f"NAME = {name!r}\n", encoding="utf-8"
+        )
+    specs = [str(tmp_path / f"{name}.py") for name in names]
+    specs.insert(2, str(tmp_path / "missing.py"))
+
+    loaded = http_server.load_algorithm_modules(specs)
+
+    assert [module.NAME for module in loaded] == names
+
+
+def test_run_with_workers_uses_app_factory(
+    monkeypatch, tmp_path, isolated_logging
+):
+    env_path = tmp_path / ".env"
+    env_path.write_text("", encoding="utf-8")
+    monkeypatch.setenv("SERVICE_WORKERS", "3")
+    monkeypatch.setenv("SERVICE_REGISTRY_ENABLED", "false")
+    for name in ("LOG_ERROR_DIR", "LOG_PAYLOAD_DIR", "LOG_GENERAL_DIR"):
+        monkeypatch.setenv(name, "")
+    monkeypatch.delenv("ALGO_MODULES", raising=False)
+    monkeypatch.delenv("ALGO_MODULE_DIR", raising=False)
+    captured = {}
+
+    def _fake_run(app, **kwargs):
+        captured["app"] = app
+        captured.update(kwargs)
+
+    monkeypatch.setattr(uvicorn, "run", _fake_run)
+
+    http_server.run(env_path=env_path)
+
+    assert captured["app"] == (
+        "algo_sdk.http.impl.server:create_app_from_env"
+    )
+    assert captured["factory"] is True
+    assert captured["workers"] == 3
+    assert captured["access_log"] is True
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("SERVICE_REGISTRY_ENABLED", "true"),
+        ("LOG_ERROR_DIR", "logs/error"),
+    ],
+)
+def test_run_with_workers_refuses_per_worker_side_effects(
+    monkeypatch, tmp_path, isolated_logging, name, value
+):
+    env_path = tmp_path / ".env"
+    env_path.write_text("", encoding="utf-8")
+    monkeypatch.setenv("SERVICE_WORKERS", "2")
+    monkeypatch.setenv("SERVICE_REGISTRY_ENABLED", "false")
+    for log_dir in ("LOG_ERROR_DIR", "LOG_PAYLOAD_DIR", "LOG_GENERAL_DIR"):
+        monkeypatch.setenv(log_dir, "")
+    monkeypatch.setenv(name, value)
+    monkeypatch.setattr(
+        uvicorn, "run", lambda *args, **kwargs: pytest.fail("started")
+    )
+
+    with pytest.raises(ValueError, match=name):
+        http_server.run(env_path=env_path)
+
+
+def test_run_can_disable_access_log(
+    monkeypatch, tmp_path, isolated_logging
+):
+    env_path = tmp_path / ".env"
+    env_path.write_text("", encoding="utf-8")
+    monkeypatch.setenv("SERVICE_ACCESS_LOG_ENABLED", "false")
+    monkeypatch.delenv("SERVICE_WORKERS", raising=False)
+    monkeypatch.delenv("ALGO_MODULES", raising=False)
+    monkeypatch.delenv("ALGO_MODULE_DIR", raising=False)
+    captured = {}
+    monkeypatch.setattr(
+        uvicorn, "run", lambda app, **kwargs: captured.update(kwargs)
+    )
+
+    http_server.run(env_path=env_path)
+
+    assert captured["access_log"] is False
+    assert captured["proxy_headers"] is True
+    assert "backlog" not in captured
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("", 1), ("4", 4), ("0", 1), ("auto", None), (" AUTO ", None)],
+)
+def test_env_snapshot_worker_count(monkeypatch, raw, expected):
+    monkeypatch.setattr(http_server.os, "cpu_count", lambda: 6)
+    settings = http_server._EnvSnapshot.from_env({"SERVICE_WORKERS": raw})
+    assert settings.workers == (6 if expected is None else expected)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"), [(None, 5.0), ("0", 0.0), ("2.5", 2.5), ("-1", 0.0)]
+)
+def test_env_snapshot_metrics_cache_window(raw, expected):
+    env = {} if raw is None else {"SERVICE_METRICS_CACHE_S": raw}
+    settings = http_server._EnvSnapshot.from_env(env)
+    assert settings.metrics_cache_s == expected
+
+
+def test_uvicorn_options_include_socket_tuning():
+    settings = http_server._EnvSnapshot.from_env(
+        {
+            "SERVICE_BACKLOG": "4096",
+            "SERVICE_LIMIT_CONCURRENCY": "64",
+            "SERVICE_KEEPALIVE_S": "30",
+            "SERVICE_PROXY_HEADERS_ENABLED": "false",
+        }
+    )
+
+    options = http_server._uvicorn_options(settings)
+
+    assert options["backlog"] == 4096
+    assert options["limit_concurrency"] == 64
+    assert options["timeout_keep_alive"] == 30
+    assert options["server_header"] is False
+    assert options["proxy_headers"] is False
+
+
+def test_envelope_routes_declare_response_model(client):
+    paths = client.app.openapi()["paths"]
+    for path, method in (
+        ("/algorithms", "get"),
+        ("/service/info", "get"),
+        ("/algorithms/{name}/{version}/schema", "get"),
+        ("/registry/algorithms", "get"),
+    ):
+        content = paths[path][method]["responses"]["200"]["content"]
+        schema = content["application/json"]["schema"]
+        assert schema["$ref"].endswith("/AlgorithmResponse")
+
+
+def test_schema_route_reports_unknown_algorithm(client):
+    response = client.get("/algorithms/missing/v1/schema")
+    data = response.json()
+    assert data["code"] == 404
+    assert data["data"] is None
+
+
+def test_readyz_reports_state_immediately_after_transition(monkeypatch):
+    monkeypatch.setenv("SERVICE_ADMIN_ENABLED", "true")
+    app = create_app(AlgorithmRegistry())
+    with TestClient(app) as client:
+        assert client.get("/readyz").status_code == 200
+        client.post("/admin/lifecycle/draining")
+
+        response = client.get("/readyz")
+        assert response.status_code == 503
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"status": "not_ready", "state": "Draining"}
+
+
+def test_success_envelope_parts_splice_datetime():
+    head, tail = http_server._success_envelope_parts([{"name": "算法"}])
+    body = head + b"2026-01-06T00:00:00Z" + tail
+    payload = json.loads(body)
+    assert payload["datetime"] == "2026-01-06T00:00:00Z"
+    assert payload["data"] == [{"name": "算法"}]
+    assert payload["code"] == 0
+
+
+def test_large_responses_are_gzipped_and_probes_are_not():
+    registry = AlgorithmRegistry()
+    for index in range(20):
+        registry.register(_make_spec(f"algo_{index}"))
+    app = create_app(registry)
+    with TestClient(app) as client:
+        headers = {"Accept-Encoding": "gzip"}
+        listing = client.get("/algorithms", headers=headers)
+        assert listing.headers["content-encoding"] == "gzip"
+        assert len(listing.json()["data"]) == 20
+
+        healthz = client.get("/healthz", headers=headers)
+        assert "content-encoding" not in healthz.headers
+
+
+def test_schema_is_cached_until_registry_changes(monkeypatch):
+    registry = AlgorithmRegistry()
+    registry.register(_make_spec("cached"))
+    calls = []
+    original = http_server._schema_payload
+
+    def _counting_payload(spec):
+        calls.append(spec.name)
+        return original(spec)
+
+    monkeypatch.setattr(http_server, "_schema_payload", _counting_payload)
+    app = create_app(registry)
+    with TestClient(app) as client:
+        first = client.get("/algorithms/cached/v1/schema").json()
+        second = client.get("/algorithms/cached/v1/schema").json()
+        assert first["data"] == second["data"]
+        assert calls == ["cached"]
+
+        registry.register(_make_spec("other"))
+        client.get("/algorithms/cached/v1/schema")
+        assert calls == ["cached", "cached"]
+
+        missing = client.get("/algorithms/missing/v1/schema")
+        assert missing.json()["code"] == 404
+
+
+def test_rejection_envelope_escapes_request_id():
+    status_code, (head, middle, tail) = http_server._REJECTION_ENVELOPES[
+        ServiceState.DRAINING
+    ]
+    request_id = json.dumps('id-"1"-算法', ensure_ascii=False)
+    body = head + request_id.encode("utf-8") + middle + b"2026-01-06Z" + tail
+    payload = json.loads(body)
+    assert status_code == 429
+    assert payload["requestId"] == 'id-"1"-算法'
+    assert payload["datetime"] == "2026-01-06Z"
+    assert payload["algorithmName"] is None
+
+
+def test_thread_pool_size_sets_default_executor(monkeypatch):
+    monkeypatch.setenv("SERVICE_THREAD_POOL_SIZE", "2")
+    app = create_app(AlgorithmRegistry())
+
+    async def _worker_thread_name():
+        return await asyncio.to_thread(
+            lambda: threading.current_thread().name
+        )
+
+    with TestClient(app) as client:
+        name = client.portal.call(_worker_thread_name)
+    assert name.startswith("algo-invoke")
+
+
+def test_fast_json_response_matches_stdlib_encoding():
+    from fastapi.responses import JSONResponse
+
+    content = {"name": "算法", "values": [1, 2.5, None, True], "big": 1e20}
+    fast = http_server._FastJSONResponse(content)
+    assert fast.body == JSONResponse(content).body
+    assert fast.media_type == "application/json"
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        http_server._FastJSONResponse({"x": float("nan")})
+    # The words alone, inside strings, still encode normally.
+    assert http_server._FastJSONResponse(["NaN", "-Infinity"]).body == (
+        b'["NaN","-Infinity"]'
+    )
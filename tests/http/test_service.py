@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
@@ -169,3 +172,126 @@ def test_service_response_meta_overrides_error() -> None:
     assert response.context is not None
     assert response.context.traceId == "resp-trace"
     assert response.data is None
+
+
+def test_service_invoke_async_runs_off_the_event_loop_thread() -> None:
+    registry = AlgorithmRegistry()
+    registry.register(_build_spec(_DoubleAlgo))
+    threads: list[int] = []
+    hooks = ObservationHooks(
+        on_start=lambda _: threads.append(threading.get_ident()),
+    )
+    service = AlgorithmHttpService(
+        registry,
+        executor=InProcessExecutor(),
+        observation=hooks,
+    )
+
+    async def _invoke():
+        loop_thread = threading.get_ident()
+        response = await service.invoke_async(
+            "demo", "v1", _build_request(_Req(value=3))
+        )
+        return loop_thread, response
+
+    loop_thread, response = asyncio.run(_invoke())
+
+    assert response.code == 0
+    assert response.data is not None
+    assert response.data.doubled == 6
+    assert threads and threads[0] != loop_thread
+
+
+def test_service_invoke_batch_async_keeps_input_order() -> None:
+    registry = AlgorithmRegistry()
+    registry.register(_build_spec(_DoubleAlgo))
+    registry.register(_build_spec(_FailAlgo, name="fail"))
+    service = AlgorithmHttpService(registry, executor=InProcessExecutor())
+    requests = [
+        _build_request(_Req(value=i), request_id=f"req-{i}") for i in range(4)
+    ]
+
+    responses = asyncio.run(
+        service.invoke_batch_async("demo", "v1", requests, concurrency=3)
+    )
+    failed = asyncio.run(
+        service.invoke_batch_async("fail", "v1", requests[:1])
+    )
+
+    assert [r.requestId for r in responses] == [f"req-{i}" for i in range(4)]
+    assert [r.data.doubled for r in responses] == [0, 2, 4, 6]
+    assert failed[0].code == 500
+
+
+class _SaturatedExecutor(InProcessExecutor):
+    def saturated(self, spec: AlgorithmSpec) -> bool:
+        return True
+
+    def submit(self, request):  # type: ignore[override]
+        raise AssertionError("saturated executor must not be submitted to")
+
+
+def test_service_rejects_on_loop_when_executor_is_saturated() -> None:
+    registry = AlgorithmRegistry()
+    registry.register(_build_spec(_DoubleAlgo))
+    events: list[str] = []
+    hooks = ObservationHooks(
+        on_start=lambda _: events.append("start"),
+        on_error=lambda _, res: events.append(res.error.kind),
+    )
+    service = AlgorithmHttpService(
+        registry, executor=_SaturatedExecutor(), observation=hooks
+    )
+
+    response = asyncio.run(
+        service.invoke_async("demo", "v1", _build_request(_Req(value=1)))
+    )
+
+    assert response.code == 429
+    assert response.requestId == "req-1"
+    assert response.algorithm_name == "demo"
+    assert events == ["start", "rejected"]
+
+
+class _BlockingExecutor(InProcessExecutor):
+    """Admits two requests at a time and holds them until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def admission_limit(self, spec: AlgorithmSpec) -> tuple[str, int]:
+        return "pool", 2
+
+    def submit(self, request):  # type: ignore[override]
+        self.release.wait(5)
+        return super().submit(request)
+
+
+def test_service_admission_counts_requests_waiting_for_a_thread() -> None:
+    registry = AlgorithmRegistry()
+    registry.register(_build_spec(_DoubleAlgo))
+    executor = _BlockingExecutor()
+    service = AlgorithmHttpService(registry, executor=executor)
+
+    async def scenario() -> list[int]:
+        # One thread: the second request waits for it before submit().
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=1)
+        )
+        tasks = [
+            asyncio.create_task(
+                service.invoke_async(
+                    "demo", "v1", _build_request(_Req(value=i))
+                )
+            )
+            for i in range(3)
+        ]
+        try:
+            rejected = await asyncio.wait_for(tasks[2], timeout=5)
+            assert rejected.code == 429
+        finally:
+            executor.release.set()
+        return [(await task).code for task in tasks]
+
+    assert asyncio.run(scenario()) == [0, 0, 429]
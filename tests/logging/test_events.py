@@ -0,0 +1,27 @@
+import logging
+
+from algo_sdk.logging.impl.events import StandardLoggingEventLogger
+
+
+def _emit(events: StandardLoggingEventLogger, logger: logging.Logger) -> None:
+    events.info(
+        "hello %s", "world", logger=logger, extra={"k": "v"}, stacklevel=2
+    )
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        events.exception("failed", logger=logger)
+
+
+def test_event_logger_forwards_extra_and_caller_location(caplog) -> None:
+    logger = logging.getLogger("algo.test.events")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        _emit(StandardLoggingEventLogger(), logger)
+
+    info, failed = caplog.records
+    assert info.getMessage() == "hello world"
+    assert info.k == "v"
+    assert info.funcName == "_emit"
+    assert info.exc_info is None
+    assert failed.exc_info is not None
+    assert failed.exc_info[0] is RuntimeError
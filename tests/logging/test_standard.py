@@ -0,0 +1,90 @@
+import json
+import logging
+
+from algo_sdk.logging import LoggingSettings
+from algo_sdk.logging.impl.standard import (
+    JsonFormatter,
+    PayloadLogFilter,
+    StandardLoggingConfigurator,
+    _RecordQueueHandler,
+)
+
+
+def _record(**extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "algo.test", logging.INFO, __file__, 1, "hello %s", ("world",), None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_omits_builtin_record_attrs() -> None:
+    payload = json.loads(JsonFormatter().format(_record()))
+
+    assert payload["message"] == "hello world"
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "algo.test"
+    assert "taskName" not in payload
+    assert "args" not in payload
+
+
+def test_json_formatter_includes_extras_and_stringifies_unknown() -> None:
+    marker = object()
+    payload = json.loads(
+        JsonFormatter().format(_record(request_id="req-1", obj=marker))
+    )
+
+    assert payload["request_id"] == "req-1"
+    assert payload["obj"] == str(marker)
+
+
+def test_payload_filter_accepts_only_preview_records() -> None:
+    payload_filter = PayloadLogFilter()
+
+    assert payload_filter.filter(_record()) is False
+    assert payload_filter.filter(_record(request_id="req-1")) is False
+    assert payload_filter.filter(_record(input_preview="in")) is True
+    assert payload_filter.filter(_record(output_preview="out")) is True
+
+
+def test_file_handlers_write_through_queue_listener(tmp_path) -> None:
+    settings = LoggingSettings(
+        error_dir=str(tmp_path / "error"),
+        payload_dir=str(tmp_path / "payload"),
+        general_dir=None,
+        general_enabled=False,
+        level=logging.INFO,
+        rotate_when="midnight",
+        backup_count=1,
+        console_enabled=False,
+    )
+    root = logging.getLogger()
+    marker = "_algo_sdk_logging_configured"
+    saved_handlers, saved_level = root.handlers[:], root.level
+    saved_marker = getattr(root, marker, False)
+    root.handlers = []
+    setattr(root, marker, False)
+    try:
+        configurator = StandardLoggingConfigurator(settings)
+        configurator.configure()
+        assert [type(h) for h in root.handlers] == [_RecordQueueHandler]
+
+        log = logging.getLogger("algo.test")
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            log.exception("failed %s", "req-1")
+        log.info("payload", extra={"input_preview": "in"})
+        configurator.shutdown()
+    finally:
+        for handler in root.handlers:
+            handler.close()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+        setattr(root, marker, saved_marker)
+
+    error = json.loads((tmp_path / "error" / "error.log").read_text())
+    assert error["message"] == "failed req-1"
+    assert "RuntimeError: boom" in error["exc_info"]
+    payload = json.loads((tmp_path / "payload" / "payload.log").read_text())
+    assert payload["input_preview"] == "in"
@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timezone
 from typing import Any
 
@@ -11,11 +12,18 @@ from algo_sdk import (
     BaseAlgorithm,
     BaseModel,
     ExecutionConfig,
+    ExecutionRequest,
+    ExecutionResult,
     InMemoryMetrics,
     InMemoryTracer,
     InProcessExecutor,
     create_observation_hooks,
 )
+from algo_sdk.observability import (
+    AlgorithmMetricsSnapshot,
+    render_prometheus_text,
+)
+from algo_sdk.observability.impl.metrics import Histogram
 
 
 class _Req(BaseModel):
@@ -108,6 +116,18 @@ def test_metrics_and_tracing_capture_execution() -> None:
     assert status_map["req-2"] == "error"
 
 
+def test_observation_hooks_skip_missing_recorders() -> None:
+    empty = create_observation_hooks(None, None)
+    assert empty.on_start is None
+    assert empty.on_complete is None
+    assert empty.on_error is None
+
+    metrics = InMemoryMetrics()
+    single = create_observation_hooks(None, metrics)
+    assert single.on_start == metrics.on_start
+    assert single.on_error == metrics.on_error
+
+
 def test_metrics_exports_prometheus_and_otel() -> None:
     registry = AlgorithmRegistry()
     registry.register(_build_spec(_DoubleAlgo, name="demo"))
@@ -126,6 +146,146 @@ def test_metrics_exports_prometheus_and_otel() -> None:
     text = metrics.render_prometheus_text()
     assert "algo_sdk_requests_total" in text
     assert "algo_sdk_request_latency_ms_bucket" in text
+    assert metrics.render_prometheus_bytes() == text.encode("utf-8")
 
     otel_payload = metrics.build_otel_metrics()
     assert "resourceMetrics" in otel_payload
+
+
+def test_metrics_snapshot_merges_shards_in_insertion_order() -> None:
+    metrics = InMemoryMetrics()
+    names = [f"algo-{index:02d}" for index in range(40)]
+    for name in reversed(names):
+        request = ExecutionRequest(
+            spec=_build_spec(_DoubleAlgo, name=name),
+            payload={"value": 1},
+            request_id=f"req-{name}",
+        )
+        metrics.on_start(request)
+        metrics.on_complete(
+            request,
+            ExecutionResult(success=True, started_at=0.0, ended_at=0.002),
+        )
+
+    snapshot = metrics.snapshot()
+
+    assert list(snapshot) == [(name, "v1") for name in reversed(names)]
+    assert all(item.requests_total == 1 for item in snapshot.values())
+    assert all(item.inflight == 0 for item in snapshot.values())
+    assert all(
+        item.latency_ms.total_count == 1 for item in snapshot.values()
+    )
+
+
+def test_histogram_places_values_on_inclusive_upper_bounds() -> None:
+    histogram = Histogram(buckets=(5, 10, 25))
+    for value in (0.0, 5, 5.01, 10, 25, 25.5, 1e9):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.counts == (2, 2, 1, 2)
+    assert snapshot.total_count == 7
+
+
+def test_tracer_keeps_only_the_latest_finished_spans() -> None:
+    tracer = InMemoryTracer(max_spans=3)
+    spec = _build_spec(_DoubleAlgo, name="demo")
+    for index in range(5):
+        request = ExecutionRequest(
+            spec=spec, payload={"value": index}, request_id=f"req-{index}"
+        )
+        tracer.on_start(request)
+        tracer.on_complete(request, ExecutionResult(success=True))
+
+    assert [span.request_id for span in tracer.spans()] == [
+        "req-2", "req-3", "req-4"
+    ]
+    assert len(tracer.spans(clear=True)) == 3
+    assert tracer.spans() == ()
+
+
+def test_tracer_pairs_spans_per_thread_context() -> None:
+    tracer = InMemoryTracer()
+    spec = _build_spec(_DoubleAlgo, name="demo")
+    barrier = threading.Barrier(4)
+
+    def _record(index: int) -> None:
+        request = ExecutionRequest(
+            spec=spec,
+            payload={"value": index},
+            request_id=f"req-{index}",
+            context=AlgorithmContext(tenantId=f"tenant-{index}"),
+        )
+        tracer.on_start(request)
+        barrier.wait()
+        tracer.on_complete(request, ExecutionResult(success=True))
+
+    threads = [
+        threading.Thread(target=_record, args=(index,)) for index in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    tenants = {span.request_id: span.tenant_id for span in tracer.spans()}
+    assert tenants == {f"req-{i}": f"tenant-{i}" for i in range(4)}
+
+
+def test_prometheus_text_escapes_labels_on_every_series() -> None:
+    snapshot = {
+        ('a"b', "v\n1"): AlgorithmMetricsSnapshot(
+            requests_total=1,
+            requests_failed=0,
+            inflight=0,
+            latency_ms=Histogram(buckets=(5,)).snapshot(),
+            queue_wait_ms=Histogram(buckets=(5,)).snapshot(),
+        )
+    }
+
+    text = render_prometheus_text(snapshot, namespace="ns")
+
+    labels = 'algo_name="a\\"b",algo_version="v\\n1"'
+    assert f"ns_requests_total{{{labels}}} 1\n" in text
+    assert f'ns_request_latency_ms_bucket{{{labels},le="5"}} 0\n' in text
+    assert f'ns_queue_wait_ms_bucket{{{labels},le="+Inf"}} 0\n' in text
+    assert text.startswith("# HELP ns_requests_total ")
+
+
+def test_otel_payload_groups_data_points_per_metric() -> None:
+    metrics = InMemoryMetrics()
+    for name in ("alpha", "beta"):
+        request = ExecutionRequest(
+            spec=_build_spec(_DoubleAlgo, name=name),
+            payload={"value": 1},
+            request_id=f"req-{name}",
+        )
+        metrics.on_start(request)
+        metrics.on_complete(
+            request,
+            ExecutionResult(success=True, started_at=0.0, ended_at=0.002),
+        )
+
+    payload = metrics.build_otel_metrics()
+    scope = payload["resourceMetrics"][0]["scopeMetrics"][0]
+    by_name = {metric["name"]: metric for metric in scope["metrics"]}
+
+    assert list(by_name) == [
+        "requests_total",
+        "requests_failed_total",
+        "requests_inflight",
+        "request_latency_ms",
+        "queue_wait_ms",
+    ]
+    points = by_name["requests_total"]["sum"]["dataPoints"]
+    assert [p["attributes"][0]["value"]["stringValue"] for p in points] == [
+        "alpha", "beta"
+    ]
+    assert [p["asInt"] for p in points] == [1, 1]
+    latency = by_name["request_latency_ms"]["histogram"]["dataPoints"][0]
+    assert latency["count"] == 1
+    assert sum(latency["bucketCounts"]) == 1
+
+    assert InMemoryMetrics().build_otel_metrics()["resourceMetrics"][0][
+        "scopeMetrics"
+    ][0]["metrics"] == []
@@ -14,6 +14,18 @@ from algo_sdk import (
 def test_algorithm_request_requires_request_id() -> None:
     with pytest.raises(ValueError):
         AlgorithmRequest(requestId="", datetime=datetime.now(timezone.utc), data={})
+    with pytest.raises(ValueError):
+        AlgorithmRequest(
+            requestId="  ", datetime=datetime.now(timezone.utc), data={}
+        )
+
+
+def test_algorithm_request_is_frozen() -> None:
+    req = AlgorithmRequest(
+        requestId="req-1", datetime=datetime.now(timezone.utc), data={}
+    )
+    with pytest.raises(ValueError):
+        req.requestId = "req-2"
 
 
 def test_algorithm_response_success_helper() -> None:
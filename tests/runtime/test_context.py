@@ -1,3 +1,5 @@
+import asyncio
+import contextvars
 from datetime import datetime, timezone
 
 from algo_sdk import (
@@ -5,6 +7,8 @@ from algo_sdk import (
     execution_context,
     get_current_context,
     get_current_request_datetime,
+    get_current_request_id,
+    get_current_trace_id,
     get_response_meta,
     set_response_code,
     set_response_context,
@@ -34,3 +38,46 @@ def test_response_meta_and_request_datetime_roundtrip() -> None:
         assert meta.context.traceId == "resp-trace"
         assert get_current_context() is not None
         assert get_current_request_datetime() == now
+        assert get_current_request_id() == "req-1"
+        assert get_current_trace_id() == "trace-ctx"
+
+
+def test_nested_execution_context_restores_outer_state() -> None:
+    outer = AlgorithmContext(tenantId="outer")
+    with execution_context(
+        request_id="req-outer", trace_id="trace-outer", context=outer
+    ):
+        set_response_code(202)
+        with execution_context(
+            request_id="req-inner", trace_id=None, context=None
+        ):
+            assert get_current_request_id() == "req-inner"
+            assert get_current_trace_id() is None
+            assert get_current_context() is None
+            assert get_response_meta() is None
+        assert get_current_request_id() == "req-outer"
+        assert get_current_context() is outer
+        meta = get_response_meta()
+        assert meta is not None
+        assert meta.code == 202
+    assert get_current_request_id() is None
+    assert get_current_request_datetime() is None
+
+
+def test_response_meta_set_in_copied_context_stays_there() -> None:
+    with execution_context(request_id="req-1", trace_id=None, context=None):
+        contextvars.copy_context().run(set_response_code, 418)
+        assert get_response_meta() is None
+
+        async def child(code: int) -> int | None:
+            set_response_code(code)
+            await asyncio.sleep(0)
+            meta = get_response_meta()
+            return meta.code if meta is not None else None
+
+        async def siblings() -> list[int | None]:
+            return list(await asyncio.gather(child(1), child(2)))
+
+        assert asyncio.run(siblings()) == [1, 2]
+        assert get_response_meta() is None
+        assert get_current_request_id() == "req-1"
@@ -67,6 +67,21 @@ def test_hook_ordering_priority_desc_and_after_reverse() -> None:
     ]
 
 
+def test_add_hook_keeps_priority_and_registration_order() -> None:
+    events: list[str] = []
+    runtime = ServiceRuntime(hooks=[_Hook("first", events, priority=1)])
+    runtime.add_hook(_Hook("second", events, priority=1))
+    runtime.add_hook(_Hook("urgent", events, priority=5))
+
+    asyncio.run(runtime.provisioning())
+
+    assert events[:3] == [
+        "before:urgent:Provisioning",
+        "before:first:Provisioning",
+        "before:second:Provisioning",
+    ]
+
+
 def test_phase_reentry_raises_already_in_state() -> None:
     runtime = ServiceRuntime()
 
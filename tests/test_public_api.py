@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from algo_sdk import (
     Algorithm,
     AlgorithmContext,
@@ -45,3 +50,15 @@ def test_public_api_imports() -> None:
     assert callable(api_success)
     assert callable(api_error)
     assert callable(execution_context)
+
+
+def test_importing_algo_sdk_defers_web_stack() -> None:
+    code = (
+        "import sys, algo_sdk\n"
+        "assert 'fastapi' not in sys.modules\n"
+        "assert callable(algo_sdk.http_server.create_app)\n"
+        "assert 'fastapi' in sys.modules\n"
+    )
+    src_dir = Path(__file__).resolve().parent.parent / "src"
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)